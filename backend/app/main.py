@@ -3,12 +3,12 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pathlib import Path
-from werkzeug.utils import secure_filename
-from sqlalchemy import text, inspect
+from sqlalchemy import text, inspect, select
 from sqlalchemy.orm import Session
 from .config import settings
 from .deps import get_db
 from .schemas import Token
+import functools
 import re
 
 # Setup logging FIRST before any other imports that might use logging
@@ -26,6 +26,9 @@ from .routers import collections as collections_router
 from .routers.auth import perform_password_login
 from .middleware import RequestTracingMiddleware, DynamicCORSMiddleware
 
+# Characters permitted in SPA static asset paths; anything else falls back to index.html
+_SAFE_PATH_RE = re.compile(r"[A-Za-z0-9_./\-]+")
+
 
 def run_migrations():
     """
@@ -44,8 +47,10 @@ def run_migrations():
                        "supports_image_processing", "gemini_model", "must_change_password", "niimbot_printer_config",
                        "additional_info", "thumbnail_path", "location_category", "custom_location_categories",
                        "paint_info", "is_living", "birthdate", "contact_info", "relationship_type", 
-                       "is_current_user", "associated_user_id"}
-    ALLOWED_TYPES = {"VARCHAR(255)", "VARCHAR(20)", "VARCHAR(64)", "VARCHAR(7)", "VARCHAR(100)", "BOOLEAN DEFAULT FALSE", "BOOLEAN DEFAULT TRUE", "INTEGER DEFAULT 7", "TIMESTAMP", "TEXT", "JSON", "VARCHAR(1024)", "VARCHAR(50)", "DATE", "UUID"}
+                       "is_current_user", "associated_user_id", "primary_photo_id",
+                       "purchase_price_cents", "estimated_value_cents",
+                       "estimated_property_value_cents", "estimated_value_with_items_cents"}
+    ALLOWED_TYPES = {"VARCHAR(255)", "VARCHAR(20)", "VARCHAR(64)", "VARCHAR(7)", "VARCHAR(100)", "BOOLEAN DEFAULT FALSE", "BOOLEAN DEFAULT TRUE", "INTEGER DEFAULT 7", "TIMESTAMP", "TEXT", "JSON", "VARCHAR(1024)", "VARCHAR(50)", "DATE", "UUID", "BIGINT"}
     
     # Define migrations: (table_name, column_name, column_definition)
     migrations = [
@@ -99,7 +104,15 @@ def run_migrations():
         ("items", "relationship_type", "VARCHAR(100)"),
         ("items", "is_current_user", "BOOLEAN DEFAULT FALSE"),
         ("items", "associated_user_id", "UUID"),
+        # Item model: denormalized primary photo reference
+        ("items", "primary_photo_id", "UUID"),
+        # Monetary columns stored as integer cents (replacing NUMERIC(12,2) columns)
+        ("items", "purchase_price_cents", "BIGINT"),
+        ("items", "estimated_value_cents", "BIGINT"),
+        ("locations", "estimated_property_value_cents", "BIGINT"),
+        ("locations", "estimated_value_with_items_cents", "BIGINT"),
     ]
+    added_columns = set()
     
     with engine.begin() as conn:
         # Create inspector inside the connection context for fresh metadata
@@ -131,11 +144,94 @@ def run_migrations():
                 # Using text() with pre-validated identifiers from whitelist
                 alter_stmt = text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
                 conn.execute(alter_stmt)
+                added_columns.add((table_name, column_name))
                 # Transaction is automatically committed by engine.begin() context manager
                 print(f"Migration: Added column '{column_name}' to table '{table_name}'")
             except Exception as e:
                 print(f"Migration warning: Could not add column '{column_name}' to '{table_name}': {e}")
 
+        # Backfill the denormalized primary photo reference once, when the column is first added
+        if ("items", "primary_photo_id") in added_columns:
+            items_table = models.Item.__table__
+            photos_table = models.Photo.__table__
+            primary_photo = (
+                select(photos_table.c.id)
+                .where(photos_table.c.item_id == items_table.c.id, photos_table.c.is_primary.is_(True))
+                .limit(1)
+                .scalar_subquery()
+            )
+            # Pass updated_at through so the column's onupdate doesn't stamp every item
+            conn.execute(
+                items_table.update().values(
+                    primary_photo_id=primary_photo, updated_at=items_table.c.updated_at
+                )
+            )
+            print("Migration: Backfilled 'primary_photo_id' on table 'items'")
+
+        # Copy legacy NUMERIC(12,2) dollar values into the new cents columns once
+        cents_backfills = [
+            ("items", "purchase_price"),
+            ("items", "estimated_value"),
+            ("locations", "estimated_property_value"),
+            ("locations", "estimated_value_with_items"),
+        ]
+        for table_name, legacy_column in cents_backfills:
+            cents_column = f"{legacy_column}_cents"
+            if (table_name, cents_column) not in added_columns:
+                continue
+            legacy_columns = [col['name'] for col in inspector.get_columns(table_name)]
+            if legacy_column not in legacy_columns:
+                continue
+            conn.execute(text(
+                f"UPDATE {table_name} SET {cents_column} = CAST(ROUND({legacy_column} * 100) AS BIGINT) "
+                f"WHERE {legacy_column} IS NOT NULL"
+            ))
+            print(f"Migration: Backfilled '{cents_column}' on table '{table_name}'")
+
+        # PostgreSQL only: convert legacy json columns to jsonb (before any
+        # jsonb-specific indexes are created below)
+        if conn.dialect.name == "postgresql":
+            migrate_json_columns_to_jsonb(conn)
+            # items.primary_photo_id is a plain column; databases created while
+            # it was declared as a foreign key carry an Item <-> Photo FK cycle
+            conn.execute(text("ALTER TABLE items DROP CONSTRAINT IF EXISTS items_primary_photo_id_fkey"))
+            # Item.data_tag_photo_id was replaced by Photo.is_data_tag; dropping
+            # the column also drops its FK to photos. SQLite keeps the column:
+            # it cannot drop a column that carries a foreign key without
+            # rebuilding the table, and the unused, nullable column is harmless
+            conn.execute(text("ALTER TABLE items DROP COLUMN IF EXISTS data_tag_photo_id"))
+
+        # Drop indexes that the models have replaced with partial or composite
+        # versions, that duplicate the leading column of a unique constraint, or
+        # whose column is no longer used
+        superseded_indexes = [
+            "ix_items_is_living",
+            "ix_items_location_id",
+            "ix_items_upc",
+            "ix_users_google_id",
+            "ix_users_oidc_id",
+            "ix_users_api_key",
+            "ix_user_printer_configs_user_id",
+            "ix_items_data_tag_photo_id",
+        ]
+        for index_name in superseded_indexes:
+            try:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            except Exception as e:
+                print(f"Migration warning: Could not drop index '{index_name}': {e}")
+
+        # create_all() only emits CREATE INDEX for tables it creates itself, so
+        # indexes added to existing models are created here
+        existing_tables = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            for index in table.indexes:
+                try:
+                    index.create(conn, checkfirst=True)
+                except Exception as e:
+                    print(f"Migration warning: Could not create index '{index.name}' on '{table.name}': {e}")
+
         # Create agent_models table for RL categorization agent
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS agent_models (
@@ -171,6 +267,44 @@ def run_migrations():
         migrate_niimbot_configs_to_profiles(conn)
 
 
+def migrate_json_columns_to_jsonb(conn):
+    """
+    Convert json columns on PostgreSQL to jsonb.
+
+    The models declare these columns with a JSONB variant on PostgreSQL, but
+    databases created before that change still store them as text-backed json.
+    SQLite has no jsonb type and is never passed to this function.
+    """
+    # (table_name, column_name) pairs; identifiers are fixed, never user input
+    jsonb_columns = [
+        ("users", "upc_databases"),
+        ("locations", "owner_info"),
+        ("locations", "landlord_info"),
+        ("locations", "tenant_info"),
+        ("locations", "insurance_info"),
+        ("locations", "paint_info"),
+        ("items", "warranties"),
+        ("items", "contact_info"),
+        ("items", "additional_info"),
+    ]
+
+    inspector = inspect(conn)
+    for table_name, column_name in jsonb_columns:
+        if table_name not in inspector.get_table_names():
+            continue
+        columns = {col['name']: col['type'] for col in inspector.get_columns(table_name)}
+        column_type = columns.get(column_name)
+        if column_type is None or column_type.__class__.__name__ == "JSONB":
+            continue
+        try:
+            conn.execute(text(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE jsonb USING {column_name}::jsonb"
+            ))
+            print(f"Migration: Converted '{table_name}.{column_name}' to jsonb")
+        except Exception as e:
+            print(f"Migration warning: Could not convert '{table_name}.{column_name}' to jsonb: {e}")
+
+
 def migrate_niimbot_configs_to_profiles(conn):
     """
     Migrate existing niimbot_printer_config JSON to new Phase 2D profile-based schema.
@@ -296,31 +430,30 @@ run_migrations()
 # Seed the database with demo data only when AUTO_SEED is explicitly enabled.
 # WARNING: seed accounts use well-known credentials — never enable AUTO_SEED in production.
 if settings.AUTO_SEED:
-    try:
-        db = SessionLocal()
-        seed_database(db)
-
-        def warn_missing_data(entity_name: str, count: int):
-            """Log warning if entity count is zero after seeding."""
-            if count == 0:
-                print(f"⚠️  WARNING: No {entity_name} found after seeding! See SEEDING.md for troubleshooting.")
+    def warn_missing_data(entity_name: str, count: int):
+        """Log warning if entity count is zero after seeding."""
+        if count == 0:
+            print(f"⚠️  WARNING: No {entity_name} found after seeding! See SEEDING.md for troubleshooting.")
 
-        warn_missing_data("items", db.query(models.Item).count())
-        warn_missing_data("locations", db.query(models.Location).count())
-        db.close()
+    try:
+        # Session context manager guarantees the connection is returned to the
+        # pool even if seeding raises part-way through
+        with SessionLocal() as db:
+            seed_database(db)
+            warn_missing_data("items", db.query(models.Item).count())
+            warn_missing_data("locations", db.query(models.Location).count())
     except Exception as e:
         print(f"Error seeding database: {e}")
 else:
     # Warn operators when the database is empty and no admin account has been created
     try:
-        db = SessionLocal()
-        admin_count = db.query(models.User).filter(
-            models.User.role == models.UserRole.ADMIN,
-            models.User.is_approved == True
-        ).count()
+        with SessionLocal() as db:
+            admin_count = db.query(models.User).filter(
+                models.User.role == models.UserRole.ADMIN,
+                models.User.is_approved == True
+            ).count()
         if admin_count == 0:
             print("ℹ️  No approved admin account found. Open the app to complete initial setup.")
-        db.close()
     except Exception as e:
         print(f"Startup check warning: {e}")
 
@@ -405,11 +538,12 @@ app = FastAPI(
 )
 
 # CORS origins now come from environment (.env or config)
-def get_cors_origins():
+@functools.cache
+def get_cors_origins() -> tuple[str, ...]:
     # settings.CORS_ORIGINS may be already a list, or a string split by comma
     if isinstance(settings.CORS_ORIGINS, str):
-        return [o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip()]
-    return settings.CORS_ORIGINS or []
+        return tuple(o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip())
+    return tuple(settings.CORS_ORIGINS or ())
 
 app.add_middleware(
     DynamicCORSMiddleware,
@@ -514,13 +648,11 @@ async def serve_frontend(full_path: str):
     if ".." in full_path or full_path.startswith("/"):
         return FileResponse(STATIC_DIR / "index.html")
     
-    # Check if this is a static file request, sanitize each path segment
-    segments = full_path.split('/')
-    safe_segments = [secure_filename(seg) for seg in segments if seg and seg not in ('.', '..')]
-    static_file = STATIC_DIR
-    for seg in safe_segments:
-        static_file = static_file / seg
-    static_file = static_file.resolve()
+    # Reject anything outside the safe character set in a single pass
+    if full_path and not _SAFE_PATH_RE.fullmatch(full_path):
+        return FileResponse(STATIC_DIR / "index.html")
+
+    static_file = (STATIC_DIR / full_path).resolve()
     
     # Ensure the resolved path is within STATIC_DIR
     try:
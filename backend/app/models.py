@@ -1,12 +1,16 @@
+import os
+import time
 import uuid
-from datetime import datetime, date
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
 import enum
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     String,
+    CheckConstraint,
     DateTime,
-    Enum,
     ForeignKey,
     Boolean,
     Integer,
@@ -16,14 +20,81 @@ from sqlalchemy import (
     JSON,
     Table,
     Float,
+    Index,
     UniqueConstraint,
+    event,
+    func,
+    inspect,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.types import TypeDecorator
 
 from .database import Base
 
+# JSON on SQLite, binary JSONB on PostgreSQL (no reparse on read, GIN-indexable)
+JSONType = JSON().with_variant(JSONB(astext_type=Text()), 'postgresql')
+
+# Capped VARCHAR for file/tree paths; plain TEXT on PostgreSQL (same storage, no length check)
+PathType = String(1024).with_variant(Text(), 'postgresql')
+
+def utcnow() -> datetime:
+    """
+    Naive UTC timestamp for created/updated columns.
+
+    Generated client-side so values keep microsecond precision on SQLite,
+    whose CURRENT_TIMESTAMP only has whole seconds, and stay UTC on
+    PostgreSQL regardless of the session time zone. server_default=func.now()
+    only covers rows inserted outside the ORM.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Layout: 48-bit Unix timestamp in milliseconds, 4-bit version, 74 random
+    bits and the 2-bit variant. Because the timestamp leads, new keys append
+    to the end of primary-key indexes instead of landing at random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | ((rand >> 62) & 0xFFF) << 64
+        | 0b10 << 62
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)
+    )
+    return uuid.UUID(int=value)
+
+
+def money_property(cents_attr: str) -> hybrid_property:
+    """
+    Expose a BIGINT cents column as a Decimal dollar amount.
+
+    Callers keep reading and assigning dollar values (Decimal, float, int or
+    str) while the database stores a fixed-width integer.
+    """
+    def fget(self):
+        cents = getattr(self, cents_attr)
+        return None if cents is None else Decimal(cents).scaleb(-2)
+
+    def fset(self, value):
+        if value is None:
+            setattr(self, cents_attr, None)
+        else:
+            cents = (Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP)
+            setattr(self, cents_attr, int(cents))
+
+    def expr(cls):
+        return getattr(cls, cents_attr) / 100.0
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
 # Use String-based UUID for SQLite compatibility
 class UUID(TypeDecorator):
     """Platform-independent UUID type. Uses PostgreSQL's UUID type, otherwise uses String."""
@@ -32,28 +103,50 @@ class UUID(TypeDecorator):
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(PostgresUUID())
+            return dialect.type_descriptor(PostgresUUID(as_uuid=True))
         else:
             return dialect.type_descriptor(String(36))
 
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == 'postgresql':
-            return str(value)
-        else:
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            return value
+    # bind_processor/result_processor are overridden instead of process_bind_param/
+    # process_result_value so the dialect branch is taken once per compiled
+    # statement rather than once per value.
+    def bind_processor(self, dialect):
+        to_uuid = uuid.UUID
 
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return value
-        else:
-            if isinstance(value, uuid.UUID):
+        if dialect.name == 'postgresql':
+            # Hand uuid.UUID objects to PostgresUUID(as_uuid=True)'s own bind
+            # processor, which converts them for the driver in use
+            impl_processor = self._unwrapped_dialect_impl(dialect).bind_processor(dialect)
+
+            def process(value):
+                if value is not None and value.__class__ is not to_uuid:
+                    value = to_uuid(value)
+                return impl_processor(value) if impl_processor else value
+            return process
+
+        def process(value):
+            if value is None or value.__class__ is str:
                 return value
-            else:
-                return uuid.UUID(value)
+            return str(value)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        if dialect.name == 'postgresql':
+            # PostgresUUID(as_uuid=True) turns the driver's value into uuid.UUID
+            # (None when the driver already returns uuid.UUID objects)
+            return self._unwrapped_dialect_impl(dialect).result_processor(dialect, coltype)
+
+        to_uuid = uuid.UUID
+
+        def process(value):
+            return None if value is None else to_uuid(value)
+        return process
+
+
+def enum_check(column: str, enum_cls: type[enum.Enum]) -> str:
+    """Build a CHECK expression restricting a String column to an enum's values."""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return f"{column} IN ({values})"
 
 
 # Updated Enum for UserRole with proper string-based Enum
@@ -69,30 +162,32 @@ user_location_access = Table(
     'user_location_access',
     Base.metadata,
     Column('user_id', UUID(), ForeignKey('users.id'), primary_key=True),
-    Column('location_id', UUID(), ForeignKey('locations.id'), primary_key=True)
+    Column('location_id', UUID(), ForeignKey('locations.id'), primary_key=True),
+    # The composite PK only serves user -> locations; this covering index serves
+    # location -> users without visiting the table
+    Index('ix_ula_location', 'location_id', 'user_id'),
 )
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=True)  # Nullable for Google OAuth users
     full_name = Column(String(255), nullable=True)
     
     # Google OAuth - stores Google account ID for SSO
-    google_id = Column(String(255), unique=True, nullable=True, index=True)
+    google_id = Column(String(255), nullable=True)
     
     # OIDC - stores OIDC account ID for SSO
-    oidc_id = Column(String(255), unique=True, nullable=True, index=True)
+    oidc_id = Column(String(255), nullable=True)
 
-    # Pass the values of the Enum directly to avoid type confusion
-    role = Column(Enum(UserRole.ADMIN, UserRole.EDITOR, UserRole.VIEWER, name="user_role", type_=String),
-                  nullable=False, default=UserRole.ADMIN)
+    # Plain string column constrained to UserRole values (no native ENUM type)
+    role = Column(String(32), nullable=False, default=UserRole.ADMIN.value)
     
     # API key for mobile/external app authentication
-    api_key = Column(String(64), unique=True, nullable=True, index=True)
+    api_key = Column(String(64), nullable=True)
     
     # Approval status for new users (admins must approve before they can access the system)
     is_approved = Column(Boolean, default=False, nullable=False)
@@ -112,7 +207,7 @@ class User(Base):
     # UPC Database Configuration - stored as JSON array with priority order
     # Format: [{"id": "gemini", "enabled": true, "api_key": null}, {"id": "upcdatabase", "enabled": true, "api_key": "..."}, ...]
     # The order of items in the array determines the lookup priority (first = highest priority)
-    upc_databases = Column(JSON, nullable=True)
+    upc_databases = Column(JSONType, nullable=True)
     
     # AI Provider Configuration - stored as JSON array with priority
     # Format: [{"id": "gemini", "enabled": true, "priority": 1, "api_key": "..."}, {"id": "chatgpt", "enabled": false, "priority": 2, "api_key": null}, ...]
@@ -123,8 +218,8 @@ class User(Base):
     # Format: {"enabled": true, "model": "b21", "connection_type": "usb", "address": "/dev/ttyACM0", "density": 3}
     niimbot_printer_config = Column(JSON, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     # Relationship for location access (many-to-many)
     allowed_locations = relationship("Location", secondary=user_location_access, back_populates="allowed_users")
@@ -137,13 +232,33 @@ class User(Base):
     label_profiles = relationship("LabelProfile", back_populates="user", cascade="all, delete-orphan")
     user_printer_configs = relationship("UserPrinterConfig", back_populates="user", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        CheckConstraint(enum_check("role", UserRole), name="ck_users_role"),
+        # Partial unique indexes: most users have no SSO id or API key, so the
+        # NULL rows are left out of the index entirely
+        Index('uq_users_google_id', 'google_id', unique=True,
+              postgresql_where=text('google_id IS NOT NULL'),
+              sqlite_where=text('google_id IS NOT NULL')),
+        Index('uq_users_oidc_id', 'oidc_id', unique=True,
+              postgresql_where=text('oidc_id IS NOT NULL'),
+              sqlite_where=text('oidc_id IS NOT NULL')),
+        Index('uq_users_api_key', 'api_key', unique=True,
+              postgresql_where=text('api_key IS NOT NULL'),
+              sqlite_where=text('api_key IS NOT NULL')),
+        Index('ix_users_upc_databases_gin', 'upc_databases', postgresql_using='gin',
+              postgresql_ops={'upc_databases': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+    )
+
 
 # Association table for many-to-many relationship between items and tags
 item_tags = Table(
     'item_tags',
     Base.metadata,
     Column('item_id', UUID(), ForeignKey('items.id'), primary_key=True),
-    Column('tag_id', UUID(), ForeignKey('tags.id'), primary_key=True)
+    Column('tag_id', UUID(), ForeignKey('tags.id'), primary_key=True),
+    # The composite PK only serves item -> tags; this covering index serves
+    # tag -> items without visiting the table
+    Index('ix_item_tags_tag', 'tag_id', 'item_id'),
 )
 
 
@@ -161,10 +276,10 @@ class LocationType(str, enum.Enum):
 class Location(Base):
     __tablename__ = "locations"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
-    parent_id = Column(UUID(), ForeignKey("locations.id"), nullable=True)
-    full_path = Column(String(1024), nullable=True)
+    parent_id = Column(UUID(), ForeignKey("locations.id"), nullable=True, index=True)
+    full_path = Column(PathType, nullable=True)
     
     # Flag for primary/main locations (homes)
     is_primary_location = Column(Boolean, default=False, nullable=False)
@@ -180,15 +295,14 @@ class Location(Base):
     description = Column(Text, nullable=True)
     address = Column(Text, nullable=True)
     
-    # Owner information stored as JSON for SQLite compatibility
-    # Note: backend/models.py uses JSONB for PostgreSQL compatibility
+    # Owner information stored as JSON (JSONB on PostgreSQL)
     # {
     #   "owner_name": "...",
     #   "spouse_name": "...",
     #   "contact_info": "...",
     #   "notes": "..."
     # }
-    owner_info = Column(JSON, nullable=True)
+    owner_info = Column(JSONType, nullable=True)
     
     # Landlord information for multi-family/apartment buildings
     # {
@@ -199,7 +313,7 @@ class Location(Base):
     #   "address": "...",
     #   "notes": "..."
     # }
-    landlord_info = Column(JSON, nullable=True)
+    landlord_info = Column(JSONType, nullable=True)
     
     # Tenant information for units/apartments
     # {
@@ -211,10 +325,9 @@ class Location(Base):
     #   "rent_amount": ...,
     #   "notes": "..."
     # }
-    tenant_info = Column(JSON, nullable=True)
+    tenant_info = Column(JSONType, nullable=True)
     
-    # Insurance information stored as JSON for SQLite compatibility
-    # Note: backend/models.py uses JSONB for PostgreSQL compatibility
+    # Insurance information stored as JSON (JSONB on PostgreSQL)
     # {
     #   "company_name": "...",
     #   "policy_number": "...",
@@ -222,7 +335,7 @@ class Location(Base):
     #   "coverage_amount": ...,
     #   "notes": "..."
     # }
-    insurance_info = Column(JSON, nullable=True)
+    insurance_info = Column(JSONType, nullable=True)
 
     # Paint color records for surfaces in this location — stored as JSON array
     # Each entry represents one surface (Walls, Trim, Ceiling, Exterior, Other):
@@ -243,35 +356,51 @@ class Location(Base):
     #   "hex_color": "#F5F0E8",
     #   "notes": ""
     # }]
-    paint_info = Column(JSON, nullable=True)
+    paint_info = Column(JSONType, nullable=True)
     
-    estimated_property_value = Column(Numeric(12, 2), nullable=True)
-    estimated_value_with_items = Column(Numeric(12, 2), nullable=True)
+    # Monetary values are stored as integer cents; the dollar properties wrap them
+    estimated_property_value_cents = Column(BigInteger, nullable=True)
+    estimated_value_with_items_cents = Column(BigInteger, nullable=True)
+    estimated_property_value = money_property("estimated_property_value_cents")
+    estimated_value_with_items = money_property("estimated_value_with_items_cents")
     
-    # Use explicit enum values for SQLAlchemy compatibility
-    location_type = Column(
-        Enum(LocationType.RESIDENTIAL, LocationType.COMMERCIAL, LocationType.RETAIL, 
-             LocationType.INDUSTRIAL, LocationType.APARTMENT_COMPLEX, LocationType.CONDO,
-             LocationType.MULTI_FAMILY, LocationType.OTHER, name="location_type"),
-        nullable=True
-    )
+    # Plain string column constrained to LocationType values
+    location_type = Column(String(32), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
-    parent = relationship("Location", remote_side=[id], backref="children")
+    # selectin on children: walking a tree costs one IN (...) query per depth level
+    parent = relationship("Location", remote_side=[id], backref=backref("children", lazy="selectin"))
     items = relationship("Item", back_populates="location")
     videos = relationship("Video", back_populates="location", cascade="all, delete-orphan")
     location_photos = relationship("LocationPhoto", back_populates="location", cascade="all, delete-orphan")
     
     # Relationship for user access control (many-to-many)
-    allowed_users = relationship("User", secondary="user_location_access", back_populates="allowed_locations")
+    allowed_users = relationship("User", secondary=user_location_access, back_populates="allowed_locations")
+
+    # GIN indexes for jsonb containment (@>) queries; jsonb_path_ops only
+    # supports @> but is about half the size of the default opclass
+    __table_args__ = (
+        CheckConstraint(enum_check("location_type", LocationType), name="ck_locations_location_type"),
+        # Prefix index so descendant lookups (full_path LIKE '/Home/%') use an index scan
+        Index('ix_locations_full_path_prefix', 'full_path',
+              postgresql_ops={'full_path': 'text_pattern_ops'}).ddl_if(dialect='postgresql'),
+        Index('ix_locations_owner_info_gin', 'owner_info', postgresql_using='gin',
+              postgresql_ops={'owner_info': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+        Index('ix_locations_insurance_info_gin', 'insurance_info', postgresql_using='gin',
+              postgresql_ops={'insurance_info': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+        Index('ix_locations_tenant_info_gin', 'tenant_info', postgresql_using='gin',
+              postgresql_ops={'tenant_info': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+        Index('ix_locations_landlord_info_gin', 'landlord_info', postgresql_using='gin',
+              postgresql_ops={'landlord_info': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+    )
 
 
 class Item(Base):
     __tablename__ = "items"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
 
@@ -280,8 +409,11 @@ class Item(Base):
     serial_number = Column(String(255), nullable=True)
 
     purchase_date = Column(Date, nullable=True)
-    purchase_price = Column(Numeric(12, 2), nullable=True)
-    estimated_value = Column(Numeric(12, 2), nullable=True)
+    # Monetary values are stored as integer cents; the dollar properties wrap them
+    purchase_price_cents = Column(BigInteger, nullable=True)
+    estimated_value_cents = Column(BigInteger, nullable=True)
+    purchase_price = money_property("purchase_price_cents")
+    estimated_value = money_property("estimated_value_cents")
     # Tracking for estimated value source (AI or user)
     estimated_value_ai_date = Column(String(20), nullable=True)  # Date when AI estimated (MM/DD/YY format)
     estimated_value_user_date = Column(String(20), nullable=True)  # Date when user supplied (MM/DD/YY format)
@@ -289,14 +421,13 @@ class Item(Base):
     retailer = Column(String(255), nullable=True)
 
     # UPC / barcode
-    upc = Column(String(64), nullable=True, index=True)
+    upc = Column(String(64), nullable=True)
 
-    # JSON column for cross-database compatibility (SQLite/PostgreSQL)
-    # Note: PostgreSQL JSONB offers better performance, but JSON works across both
-    warranties = Column(JSON, nullable=True)
+    # JSON on SQLite, JSONB on PostgreSQL
+    warranties = Column(JSONType, nullable=True)
     
     # Living item fields (for people, pets, plants, etc.)
-    is_living = Column(Boolean, default=False, nullable=False, index=True)
+    is_living = Column(Boolean, default=False, nullable=False)
     birthdate = Column(Date, nullable=True)
     # Contact information stored as JSON for flexibility
     # {
@@ -305,65 +436,153 @@ class Item(Base):
     #   "address": "...",
     #   "notes": "..."
     # }
-    contact_info = Column(JSON, nullable=True)
+    contact_info = Column(JSONType, nullable=True)
     
     # Dynamic fields for additional information (key-value pairs)
     # Format: [{"label": "Related URL", "value": "...", "type": "url"}, {"label": "Notes", "value": "...", "type": "text"}]
-    additional_info = Column(JSON, nullable=True)
+    additional_info = Column(JSONType, nullable=True)
 
     # Relationship to logged-in user (e.g., "mother", "father", "sister", "pet", "plant")
     relationship_type = Column(String(100), nullable=True, index=True)
     # Flag if this living item is the currently logged-in user themselves
     is_current_user = Column(Boolean, default=False, nullable=False)
     # Reference to the user account if this living item is associated with a user
-    associated_user_id = Column(UUID(), ForeignKey("users.id"), nullable=True)
+    associated_user_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
 
     # Relationships
+    # Indexed by ix_items_location_name (location_id is its leading column)
     location_id = Column(UUID(), ForeignKey("locations.id"), nullable=True)
-    data_tag_photo_id = Column(UUID(), ForeignKey("photos.id"), nullable=True)
+    # Denormalized copy of the photo flagged is_primary, kept in sync by the Photo
+    # mapper events below so list views can render thumbnails without a join.
+    # Deliberately not a foreign key: photos.item_id already references items,
+    # and a reverse FK would make the two tables a cycle
+    primary_photo_id = Column(UUID(), nullable=True, index=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     location = relationship("Location", back_populates="items")
-    photos = relationship("Photo", back_populates="item", foreign_keys="[Photo.item_id]", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="item", cascade="all, delete-orphan")
+    # photos/documents/tags are serialized with every item response, so they
+    # are batch-loaded with one IN query per relationship
+    photos = relationship("Photo", back_populates="item", foreign_keys="[Photo.item_id]", cascade="all, delete-orphan", lazy="selectin")
+    documents = relationship("Document", back_populates="item", cascade="all, delete-orphan", lazy="selectin")
     maintenance_tasks = relationship("MaintenanceTask", back_populates="item", cascade="all, delete-orphan")
-    tags = relationship("Tag", secondary=item_tags, back_populates="items")
-    associated_user = relationship("User", foreign_keys=[associated_user_id], back_populates="living_items")
-
-    data_tag_photo = relationship("Photo", foreign_keys=[data_tag_photo_id], post_update=True)
+    tags = relationship("Tag", secondary=item_tags, back_populates="items", lazy="selectin")
+    # Only loaded intentionally (selectinload/joinedload at the call site)
+    associated_user = relationship("User", foreign_keys=[associated_user_id], back_populates="living_items", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Per-location item listing, returned in name order straight off the index
+        Index('ix_items_location_name', 'location_id', 'name'),
+        # Partial indexes: only the rare True / non-NULL rows are indexed
+        Index('ix_items_upc_partial', 'upc',
+              postgresql_where=text('upc IS NOT NULL'),
+              sqlite_where=text('upc IS NOT NULL')),
+        Index('ix_items_current_user', 'associated_user_id',
+              postgresql_where=text('is_current_user = true'),
+              sqlite_where=text('is_current_user = 1')),
+        Index('ix_items_is_living_partial', 'id',
+              postgresql_where=text('is_living = true'),
+              sqlite_where=text('is_living = 1')),
+        # GIN index for jsonb containment (@>) queries on PostgreSQL
+        Index('ix_items_warranties_gin', 'warranties', postgresql_using='gin',
+              postgresql_ops={'warranties': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+    )
 
 
 class Photo(Base):
     __tablename__ = "photos"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False)
-    path = Column(String(1024), nullable=False)
-    thumbnail_path = Column(String(1024), nullable=True)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False, index=True)
+    path = Column(PathType, nullable=False)
+    thumbnail_path = Column(PathType, nullable=True)
     mime_type = Column(String(128), nullable=True)
 
     is_primary = Column(Boolean, default=False, nullable=False)
     is_data_tag = Column(Boolean, default=False, nullable=False)
     photo_type = Column(String(64), nullable=True)  # 'default', 'data_tag', 'receipt', 'warranty', 'optional'
 
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
 
     item = relationship("Item", back_populates="photos", foreign_keys=[item_id])
 
+    __table_args__ = (
+        # Partial index for finding items with data tag photos. Photo.is_data_tag
+        # is the single source of truth; an item may have several
+        Index('ix_photos_data_tag_item', 'item_id',
+              postgresql_where=text('is_data_tag = true'),
+              sqlite_where=text('is_data_tag = 1')),
+        # Finds an item's primary photo(s) when re-pointing the primary. Not
+        # unique: the photo routes clear the old flag before setting a new one,
+        # but the database does not enforce a single primary per item
+        Index('ix_photos_primary_item', 'item_id',
+              postgresql_where=text('is_primary = true'),
+              sqlite_where=text('is_primary = 1')),
+    )
+
+
+@event.listens_for(Photo, "after_insert")
+def sync_item_primary_photo_on_insert(mapper, connection, photo):
+    """Record a newly inserted primary photo on its item."""
+    if photo.is_primary:
+        sync_item_primary_photo(connection, photo)
+
+
+@event.listens_for(Photo, "after_update")
+def sync_item_primary_photo_on_update(mapper, connection, photo):
+    """Keep Item.primary_photo_id in step when a photo's is_primary flag or item changes."""
+    attrs = inspect(photo).attrs
+    moved = attrs.item_id.history.has_changes()
+    if moved:
+        # The photo left its old item; drop it as that item's primary. Keyed
+        # on the photo rather than history.deleted, which is empty when
+        # item_id was expired before being reassigned
+        items = Item.__table__
+        connection.execute(
+            items.update()
+            .where(items.c.primary_photo_id == photo.id, items.c.id != photo.item_id)
+            .values(primary_photo_id=None)
+        )
+    if moved or attrs.is_primary.history.has_changes():
+        sync_item_primary_photo(connection, photo)
+
+
+def sync_item_primary_photo(connection, photo):
+    """Point Item.primary_photo_id at this photo when it is primary, or clear it when it no longer is."""
+    items = Item.__table__
+    if photo.is_primary:
+        connection.execute(
+            items.update().where(items.c.id == photo.item_id).values(primary_photo_id=photo.id)
+        )
+    else:
+        connection.execute(
+            items.update()
+            .where(items.c.id == photo.item_id, items.c.primary_photo_id == photo.id)
+            .values(primary_photo_id=None)
+        )
+
+
+@event.listens_for(Photo, "after_delete")
+def clear_item_primary_photo(mapper, connection, photo):
+    """Clear Item.primary_photo_id when the primary photo is deleted."""
+    items = Item.__table__
+    connection.execute(
+        items.update().where(items.c.primary_photo_id == photo.id).values(primary_photo_id=None)
+    )
+
 
 class Document(Base):
     __tablename__ = "documents"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False, index=True)
     filename = Column(String(255), nullable=False)
     mime_type = Column(String(128), nullable=True)
-    path = Column(String(1024), nullable=False)
+    path = Column(PathType, nullable=False)
     document_type = Column(String(64), nullable=True)  # 'manual', 'attachment', etc.
 
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
 
     item = relationship("Item", back_populates="documents")
 
@@ -371,14 +590,14 @@ class Document(Base):
 class Video(Base):
     __tablename__ = "videos"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    location_id = Column(UUID(), ForeignKey("locations.id"), nullable=False)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    location_id = Column(UUID(), ForeignKey("locations.id"), nullable=False, index=True)
     filename = Column(String(255), nullable=False)
     mime_type = Column(String(128), nullable=True)
-    path = Column(String(1024), nullable=False)
+    path = Column(PathType, nullable=False)
     video_type = Column(String(64), nullable=True)  # 'room_tour', 'description', etc.
 
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
 
     location = relationship("Location", back_populates="videos")
 
@@ -386,15 +605,15 @@ class Video(Base):
 class LocationPhoto(Base):
     __tablename__ = "location_photos"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    location_id = Column(UUID(), ForeignKey("locations.id"), nullable=False)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    location_id = Column(UUID(), ForeignKey("locations.id"), nullable=False, index=True)
     filename = Column(String(255), nullable=False)
     mime_type = Column(String(128), nullable=True)
-    path = Column(String(1024), nullable=False)
-    thumbnail_path = Column(String(1024), nullable=True)
+    path = Column(PathType, nullable=False)
+    thumbnail_path = Column(PathType, nullable=True)
     photo_type = Column(String(64), nullable=True)  # 'overview', 'detail', etc.
 
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
 
     location = relationship("Location", back_populates="location_photos")
 
@@ -413,48 +632,39 @@ class RecurrenceType(str, enum.Enum):
 class MaintenanceTask(Base):
     __tablename__ = "maintenance_tasks"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    item_id = Column(UUID(), ForeignKey("items.id"), nullable=False, index=True)
 
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
 
     next_due_date = Column(Date, nullable=True)
-    recurrence_type = Column(
-        Enum(
-            RecurrenceType.NONE,
-            RecurrenceType.DAILY,
-            RecurrenceType.WEEKLY,
-            RecurrenceType.BI_WEEKLY,
-            RecurrenceType.MONTHLY,
-            RecurrenceType.BI_MONTHLY,
-            RecurrenceType.YEARLY,
-            RecurrenceType.CUSTOM_DAYS,
-            name="recurrence_type"
-        ),
-        nullable=False,
-        default=RecurrenceType.NONE
-    )
+    # Plain string column constrained to RecurrenceType values
+    recurrence_type = Column(String(32), nullable=False, default=RecurrenceType.NONE.value)
     recurrence_interval = Column(Integer, nullable=True)  # e.g. every 90 days for custom_days
     color = Column(String(7), nullable=True, default="#3b82f6")  # Hex color code
 
     last_completed = Column(Date, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     item = relationship("Item", back_populates="maintenance_tasks")
 
+    __table_args__ = (
+        CheckConstraint(enum_check("recurrence_type", RecurrenceType), name="ck_maintenance_tasks_recurrence_type"),
+    )
+
 
 class Tag(Base):
     __tablename__ = "tags"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     name = Column(String(100), nullable=False, unique=True, index=True)
     is_predefined = Column(Boolean, default=False, nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     items = relationship("Item", secondary=item_tags, back_populates="tags")
 
@@ -483,7 +693,7 @@ class SystemSettings(Base):
     # If null, default hardcoded categories are used
     custom_location_categories = Column(JSON, nullable=True)
     
-    updated_at = Column(DateTime, default=lambda: datetime.utcnow(), onupdate=lambda: datetime.utcnow(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
 
 class Plugin(Base):
@@ -495,7 +705,7 @@ class Plugin(Base):
     """
     __tablename__ = "plugins"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     name = Column(String(100), nullable=False, unique=True, index=True)
     description = Column(Text, nullable=True)
     
@@ -523,15 +733,15 @@ class Plugin(Base):
     # Priority order (lower number = higher priority)
     priority = Column(Integer, default=100, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
 
 # Phase 2D: Printer and Label Profile Models
 class PrinterProfile(Base):
     __tablename__ = "printer_profiles"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     model = Column(String(50), nullable=False)
@@ -546,8 +756,8 @@ class PrinterProfile(Base):
     default_density = Column(Integer, default=3)
     is_default = Column(Boolean, default=False)
     is_enabled = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     user = relationship("User", back_populates="printer_profiles")
     user_printer_configs = relationship("UserPrinterConfig", back_populates="printer_profile", cascade="all, delete-orphan")
@@ -556,7 +766,7 @@ class PrinterProfile(Base):
 class LabelProfile(Base):
     __tablename__ = "label_profiles"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -564,8 +774,8 @@ class LabelProfile(Base):
     length_mm = Column(Float, nullable=False)
     is_default = Column(Boolean, default=False)
     is_custom = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     user = relationship("User", back_populates="label_profiles")
     user_printer_configs = relationship("UserPrinterConfig", back_populates="label_profile", cascade="all, delete-orphan")
@@ -574,15 +784,16 @@ class LabelProfile(Base):
 class UserPrinterConfig(Base):
     __tablename__ = "user_printer_configs"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
-    printer_profile_id = Column(UUID(), ForeignKey("printer_profiles.id"), nullable=False)
-    label_profile_id = Column(UUID(), ForeignKey("label_profiles.id"), nullable=False)
+    id = Column(UUID(), primary_key=True, default=uuid7)
+    # Indexed as the leading column of unique_user_printer_label
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
+    printer_profile_id = Column(UUID(), ForeignKey("printer_profiles.id"), nullable=False, index=True)
+    label_profile_id = Column(UUID(), ForeignKey("label_profiles.id"), nullable=False, index=True)
     density = Column(Integer, default=3)
     is_active = Column(Boolean, default=True)
     is_default = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     __table_args__ = (UniqueConstraint("user_id", "printer_profile_id", "label_profile_id", name="unique_user_printer_label"),)
 
@@ -601,24 +812,24 @@ class AgentModel(Base):
     model_data = Column(Text, nullable=True)
     training_samples = Column(Integer, default=0, nullable=False)
     last_trained_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
 
 class AgentTrainingLog(Base):
     __tablename__ = "agent_training_log"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     agent_id = Column(String(100), nullable=False)
     item_id = Column(UUID(), nullable=True)  # nullable — item may be deleted
     input_text = Column(Text, nullable=False)
     predicted_series = Column(String(100), nullable=True)
     accepted_series = Column(String(100), nullable=False)
     was_override = Column(Boolean, nullable=False)
-    reward = Column(Numeric(4, 3), nullable=False)
+    reward = Column(Numeric(4, 3, asdecimal=False), nullable=False)
     user_action = Column(String(20), nullable=True)  # 'ACCEPTED' | 'REJECTED'
     source = Column(String(50), default='nesventory', nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
 
 
 # Association table for many-to-many between collections and items
@@ -628,22 +839,23 @@ collection_items = Table(
     Base.metadata,
     Column('collection_id', UUID(), ForeignKey('collections.id', ondelete='CASCADE'), primary_key=True),
     Column('item_id', UUID(), ForeignKey('items.id', ondelete='CASCADE'), primary_key=True),
-    Column('added_at', DateTime, default=datetime.utcnow, nullable=False),
-    Column('added_by', UUID(), ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+    Column('added_at', DateTime, default=utcnow, server_default=func.now(), nullable=False),
+    Column('added_by', UUID(), ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True),
     Column('sort_order', Integer, default=0, nullable=True),
     Column('notes', Text, nullable=True),
+    Index('ix_collection_items_item', 'item_id', 'collection_id'),
 )
 
 
 class Collection(Base):
     __tablename__ = "collections"
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     # Self-referencing FK; NULL = root collection; ON DELETE RESTRICT (block cascade, enforced in app)
     parent_id = Column(UUID(), ForeignKey('collections.id', ondelete='RESTRICT'), nullable=True, index=True)
-    cover_image_path = Column(String(1024), nullable=True)  # Relative path, same convention as photos.file_path
+    cover_image_path = Column(PathType, nullable=True)  # Relative path, same convention as photos.file_path
     color = Column(String(7), nullable=True)   # Hex color, e.g. "#E63946"
     icon = Column(String(100), nullable=True)  # Icon identifier / emoji
     # shared_properties JSON shape:
@@ -655,8 +867,8 @@ class Collection(Base):
     # }
     shared_properties = Column(JSON, nullable=True)
     created_by = Column(UUID(), ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False)
 
     # Self-referencing relationships
     parent = relationship("Collection", remote_side="Collection.id", back_populates="children", foreign_keys=[parent_id])
@@ -7,12 +7,14 @@ from PIL import Image
 
 from .printer import BluetoothTransport, PrinterClient, SerialTransport, InfoEnum
 
+_MAC_RE = re.compile(r"([0-9A-F]{2}:){5}([0-9A-F]{2})")
+
 
 def get_transport(conn, addr):
     if conn == "bluetooth":
         assert conn is not None, "--addr argument required for bluetooth connection"
         addr = addr.upper()
-        assert re.fullmatch(r"([0-9A-F]{2}:){5}([0-9A-F]{2})", addr), "Bad MAC address"
+        assert _MAC_RE.fullmatch(addr), "Bad MAC address"
         return BluetoothTransport(addr)
     if conn == "usb":
         port = addr if addr is not None else "auto"
@@ -1,22 +1,54 @@
+_HEADER = b"\x55\x55"
+_FOOTER = b"\xaa\xaa"
+
+# Below this many bytes a plain loop beats the int.from_bytes fold
+_FOLD_THRESHOLD = 64
+
+
+def _xor_bytes(data):
+    """XOR all bytes of ``data`` together."""
+    n = len(data)
+    if n < _FOLD_THRESHOLD:
+        checksum = 0
+        for i in data:
+            checksum ^= i
+        return checksum
+    # Long payloads: load as one int and fold halves together in C, so the
+    # work is O(log n) big-int operations instead of n interpreter steps
+    x = int.from_bytes(data, "little")
+    width = 8 << (n - 1).bit_length()
+    while width > 64:
+        width >>= 1
+        x = (x >> width) ^ (x & ((1 << width) - 1))
+    x ^= x >> 32
+    x ^= x >> 16
+    x ^= x >> 8
+    return x & 0xFF
+
+
 class NiimbotPacket:
     def __init__(self, type_, data):
         self.type = type_
-        self.data = data
+        # Bytes-like payloads are kept as-is so callers can pass a memoryview
+        # over a reused row buffer; to_bytes copies it into the frame in one go
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self.data = data
+        else:
+            self.data = bytes(data)
 
     @classmethod
     def from_bytes(cls, pkt):
-        if pkt[:2] != b"\x55\x55":
+        # startswith/endswith compare in place without allocating slices
+        if not pkt.startswith(_HEADER):
             raise ValueError(f"Invalid packet header: {pkt[:2].hex()} (expected 5555)")
-        if pkt[-2:] != b"\xaa\xaa":
+        if not pkt.endswith(_FOOTER):
             raise ValueError(f"Invalid packet footer: {pkt[-2:].hex()} (expected aaaa)")
         
         type_ = pkt[2]
         len_ = pkt[3]
         data = pkt[4 : 4 + len_]
 
-        checksum = type_ ^ len_
-        for i in data:
-            checksum ^= i
+        checksum = type_ ^ len_ ^ _xor_bytes(data)
         
         if checksum != pkt[-3]:
             raise ValueError(f"Invalid checksum: {pkt[-3]:#02x} (calculated {checksum:#02x})")
@@ -24,12 +56,41 @@ class NiimbotPacket:
         return cls(type_, data)
 
     def to_bytes(self):
-        checksum = self.type ^ len(self.data)
-        for i in self.data:
-            checksum ^= i
-        return bytes(
-            (0x55, 0x55, self.type, len(self.data), *self.data, checksum, 0xAA, 0xAA)
-        )
+        data = self.data
+        n = len(data)
+        buf = bytearray(7 + n)
+        buf[0] = 0x55
+        buf[1] = 0x55
+        buf[2] = self.type
+        buf[3] = n
+        buf[4 : 4 + n] = data
+        buf[4 + n] = self.type ^ n ^ _xor_bytes(data)
+        buf[5 + n] = 0xAA
+        buf[6 + n] = 0xAA
+        return bytes(buf)
 
     def __repr__(self):
         return f"<NiimbotPacket type={self.type} data={self.data}>"
+
+
+class PacketBuffer:
+    """
+    A reusable frame for a stream of packets with the same type and length.
+
+    Framing bytes are written once; callers fill ``payload`` in place for each
+    packet and call ``to_bytes()``, which only computes the checksum and
+    copies the frame out. Used for image rows, which are all the same size.
+    """
+
+    def __init__(self, type_, length):
+        self.frame = bytearray(7 + length)
+        self.frame[0:2] = _HEADER
+        self.frame[2] = type_
+        self.frame[3] = length
+        self.frame[-2:] = _FOOTER
+        self.payload = memoryview(self.frame)[4 : 4 + length]
+        self._type_len = type_ ^ length
+
+    def to_bytes(self):
+        self.frame[-3] = self._type_len ^ _xor_bytes(self.payload)
+        return bytes(self.frame)
@@ -1,9 +1,11 @@
 import abc
 import asyncio
+import concurrent.futures
 import enum
 import logging
-import math
 import os
+import re
+import select
 import socket
 import struct
 import threading
@@ -14,7 +16,7 @@ from bleak import BleakClient
 from PIL import Image, ImageOps
 from serial.tools.list_ports import comports as list_comports
 
-from .packet import NiimbotPacket
+from .packet import NiimbotPacket, PacketBuffer
 
 class InfoEnum(enum.IntEnum):
     DENSITY = 1
@@ -47,15 +49,151 @@ class RequestCodeEnum(enum.IntEnum):
 def _packet_to_int(x):
     return int.from_bytes(x.data, "big")
 
+# Serial Port Profile service UUID (lowercase) advertised by RFCOMM printers
+SPP_UUID = "00001101-0000-1000-8000-00805f9b34fb"
+
+# Heartbeat response length -> byte offsets of
+# (closingstate, powerlevel, paperstate, rfidreadstate); None = not reported
+_HEARTBEAT_LAYOUTS = {
+    20: (None, None, 18, 19),
+    13: (9, 10, 11, 12),
+    19: (15, 16, 17, 18),
+    10: (8, 9, None, 8),
+    9: (8, None, None, None),
+}
+
+# RFID product code: the first run of 4+ printable ASCII bytes that is
+# followed by a non-printable byte
+_RFID_PRODUCT_CODE_RE = re.compile(rb"[ -~]{4,}(?=[^ -~])")
+
+# RFID response prefixes of known label rolls: (prefix, width_mm, height_mm)
+_KNOWN_RFID_SIGNATURES = (
+    (bytes.fromhex("881d86286c121080"), 50, 30),
+)
+
+# Image rows are sent in batches of this many packets per transport write
+_ROWS_PER_WRITE = 8
+
+# Precompiled layouts for packets built on every print (row headers per row)
+_ROW_HEADER = struct.Struct(">HBBBB")  # row, C1, C2 (count lo), C3 (count hi), repeat
+_PAGE_SIZE = struct.Struct(">HHH")  # rows, cols, quantity
+_PAGE_SIZE_V5 = struct.Struct(">HHHHBBBH")
+_EMPTY_ROW = struct.Struct(">HB")  # first row, repeat count
+_RFID_DIMENSIONS = struct.Struct("BB")  # width_mm, height_mm at offset 16 of an RFID response
+
+def _empty_row_frames(start: int, count: int) -> list[bytes]:
+    """PrintEmptyRow (0x84) frames covering ``count`` blank rows from ``start``."""
+    frames = []
+    while count > 0:
+        repeat = min(count, 255)
+        frames.append(NiimbotPacket(0x84, _EMPTY_ROW.pack(start, repeat)).to_bytes())
+        start += repeat
+        count -= repeat
+    return frames
+
+def _row_runs(lines):
+    """Group consecutive identical rows into (first_row, data, count) runs."""
+    start, current, count = 0, None, 0
+    for y, line in enumerate(lines):
+        if count and line == current:
+            count += 1
+            continue
+        if count:
+            yield start, current, count
+        start, current, count = y, line, 1
+    if count:
+        yield start, current, count
+
+def _b1_row_frames(bitmap: bytes, bytes_per_row: int, compress: bool = False):
+    """
+    Yield the encoded B1 image frames for a packed bitmap.
+
+    By default every row is one 0x85 packet with a repeat count of 1. With
+    ``compress``, runs of identical rows are sent once: blank runs as
+    PrintEmptyRow (0x84) and others as 0x85 with the run length as the
+    repeat count, both split every 255 rows.
+    """
+    # One frame (6-byte header + bitmap payload) is refilled for every row;
+    # to_bytes copies it out before the next row overwrites it
+    row_pkt = PacketBuffer(0x85, 6 + bytes_per_row)
+    row_payload = row_pkt.payload
+    lines = (bitmap[i : i + bytes_per_row] for i in range(0, len(bitmap), bytes_per_row))
+    if not compress:
+        for y, line_data in enumerate(lines):
+            # Header: Row(2), C1=0, C2=0, C3=0, Rep=1
+            _ROW_HEADER.pack_into(row_payload, 0, y, 0, 0, 0, 1)
+            row_payload[6:] = line_data
+            yield row_pkt.to_bytes()
+        return
+
+    blank_row = bytes(bytes_per_row)
+    for start, line_data, count in _row_runs(lines):
+        if line_data == blank_row:
+            yield from _empty_row_frames(start, count)
+            continue
+        while count > 0:
+            repeat = min(count, 255)
+            _ROW_HEADER.pack_into(row_payload, 0, start, 0, 0, 0, repeat)
+            row_payload[6:] = line_data
+            yield row_pkt.to_bytes()
+            start += repeat
+            count -= repeat
+
+# Grayscale -> 1-bit lookup table: pixels darker than 128 become set bits
+_THRESHOLD_LUT = [255 if i < 128 else 0 for i in range(256)]
+
+def _to_grayscale(image: Image) -> Image:
+    """Return ``image`` in mode "L", without copying images that already are."""
+    # convert() to the image's own mode still copies the whole buffer
+    return image if image.mode == "L" else image.convert("L")
+
+def _threshold_bitmap(image: Image) -> tuple[bytes, int]:
+    """
+    Threshold ``image`` to a packed 1-bit bitmap in a single Pillow pass.
+
+    Returns the bitmap bytes and the row stride in bytes. Rows are MSB-first
+    with dark pixels as 1 bits, padded with 0 bits to a whole byte - the line
+    format the printer expects.
+    """
+    bitmap = _to_grayscale(image).point(_THRESHOLD_LUT, mode="1")
+    return bitmap.tobytes(), (bitmap.width + 7) // 8
+
+# One background event loop runs every BleakTransport's BLE I/O, so
+# reconnecting does not pay for a new thread and loop each time
+_ble_loop = None
+_ble_loop_lock = threading.Lock()
+
+def _get_ble_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared BLE event loop, starting its thread on first use."""
+    global _ble_loop
+    with _ble_loop_lock:
+        if _ble_loop is None:
+            try:
+                # uvloop ships with uvicorn[standard]; its libuv loop has lower
+                # per-callback overhead for notification-heavy BLE traffic
+                import uvloop
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="niimbot-ble", daemon=True).start()
+            _ble_loop = loop
+            logging.info("BleakTransport: Started shared BLE event loop")
+        return _ble_loop
+
 class BaseTransport(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def read(self, length: int) -> bytes:
+    def read(self, length: int, timeout: float | None = None) -> bytes:
+        """Read up to ``length`` bytes, waiting at most ``timeout`` seconds (None: transport default)."""
         raise NotImplementedError
 
     @abc.abstractmethod
     def write(self, data: bytes):
         raise NotImplementedError
 
+    def write_many(self, frames: list[bytes]):
+        """Write several complete packets; stream transports do it in one write."""
+        self.write(b"".join(frames))
+
     @abc.abstractmethod
     def disconnect(self):
         raise NotImplementedError
@@ -63,51 +201,37 @@ class BaseTransport(metaclass=abc.ABCMeta):
 class BleakTransport(BaseTransport):
     SERVICE_UUID = "e7810a71-73ae-499d-8c15-faa9aef0c3f2"
     CHAR_UUID = "bef8d6c9-9c21-4c9e-b632-bd58c1009f9f"
+    MAX_PENDING_WRITES = 8
 
     def __init__(self, address: str):
         self._address = address.upper()
         self._recv_buffer = bytearray()
-        self._recv_lock = threading.Lock()
+        # Notifications arrive on the BLE thread; readers wait on this condition
+        self._recv_cond = threading.Condition()
         self._client = None
-        self._loop = None
-        self._connected = threading.Event()
-        self._connect_error = None
-        self._stopping = False
+        self._loop = _get_ble_loop()
+        # Writes are queued to a pump task on the BLE loop; the semaphore caps
+        # how many submissions may be outstanding before write() blocks
+        self._write_queue = None
+        self._write_task = None
+        self._write_char = None
+        self._write_slots = threading.BoundedSemaphore(self.MAX_PENDING_WRITES)
+        self._write_error = None
         logging.info(f"BleakTransport: Connecting to {self._address}")
-        self._thread = threading.Thread(target=self._run_ble_thread, daemon=True)
-        self._thread.start()
-        logging.info("BleakTransport: Waiting for connection thread...")
-        if not self._connected.wait(timeout=30):
+        future = asyncio.run_coroutine_threadsafe(self._async_connect(), self._loop)
+        try:
+            future.result(timeout=30)
+        except concurrent.futures.TimeoutError:
             logging.error("BleakTransport: Connection timeout reached in __init__")
+            future.cancel()
             self.disconnect()
             raise TimeoutError("BLE connection timed out")
-        if self._connect_error:
-            logging.error(f"BleakTransport: Connection error reported: {self._connect_error}")
+        except Exception as e:
+            logging.error(f"BleakTransport: Connection error reported: {e}", exc_info=True)
             self.disconnect()
-            raise self._connect_error
+            raise
         logging.info(f"BleakTransport: Connected successfully")
 
-    def _run_ble_thread(self):
-        logging.info("BleakTransport: BLE thread started")
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-        try:
-            logging.info("BleakTransport: Running async_connect in loop...")
-            self._loop.run_until_complete(self._async_connect())
-            logging.info("BleakTransport: async_connect completed")
-            self._connected.set()
-            self._loop.run_forever()
-        except Exception as e:
-            if not self._stopping:
-                logging.error(f"BleakTransport: BLE thread error: {e}", exc_info=True)
-                self._connect_error = e
-            self._connected.set()
-        finally:
-            if self._loop.is_running():
-                self._loop.stop()
-            self._loop.close()
-            logging.info("BleakTransport: BLE thread event loop closed")
-
     async def _async_connect(self):
         logging.info(f"BleakTransport: Creating BleakClient for {self._address}...")
         self._client = BleakClient(self._address)
@@ -115,13 +239,68 @@ class BleakTransport(BaseTransport):
         await self._client.connect()
         logging.info(f"BleakTransport: BLE connected, starting notifications on {self.CHAR_UUID}")
         await self._client.start_notify(self.CHAR_UUID, self._notification_handler)
+        self._write_char = self._client.services.get_characteristic(self.CHAR_UUID)
+        # BlueZ runs the ATT MTU exchange itself at connect, but Bleak reports
+        # the 23-byte default until the negotiated value is fetched; write
+        # coalescing sizes its chunks from it
+        acquire_mtu = getattr(getattr(self._client, "_backend", None), "_acquire_mtu", None)
+        if acquire_mtu:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                logging.warning(f"BleakTransport: Could not acquire MTU: {e}")
+        self._write_queue = asyncio.Queue()
+        self._write_task = asyncio.create_task(self._write_pump())
         try:
             logging.info(f"BleakTransport: Negotiated MTU: {self._client.mtu_size}")
         except Exception as e:
             logging.warning(f"BleakTransport: Could not read MTU: {e}")
         logging.info("BleakTransport: Notifications started")
 
+    def _coalesce(self, frames):
+        """
+        Pack consecutive frames into as few GATT writes as the link allows.
+
+        Frames are concatenated while they fit in one write-without-response
+        PDU; a frame larger than that is still written on its own, as before.
+        """
+        try:
+            limit = self._write_char.max_write_without_response_size
+        except AttributeError:
+            limit = 20  # Default ATT MTU (23) minus the 3-byte header
+        chunk = bytearray()
+        for frame in frames:
+            if chunk and len(chunk) + len(frame) > limit:
+                yield bytes(chunk)
+                chunk.clear()
+            chunk += frame
+        if chunk:
+            yield bytes(chunk)
+
+    async def _write_pump(self):
+        while True:
+            frames = await self._write_queue.get()
+            try:
+                for chunk in self._coalesce(frames):
+                    await self._client.write_gatt_char(self.CHAR_UUID, chunk, response=False)
+            except Exception as e:
+                logging.error(f"BleakTransport: Write failed: {e}")
+                # Wake a reader waiting for a response that will never come
+                with self._recv_cond:
+                    self._write_error = e
+                    self._recv_cond.notify_all()
+            finally:
+                self._write_queue.task_done()
+                self._write_slots.release()
+
     async def _async_disconnect(self):
+        if self._write_task:
+            # Let queued writes reach the printer before tearing down
+            try:
+                await asyncio.wait_for(self._write_queue.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logging.warning("BleakTransport: Pending writes not flushed before disconnect")
+            self._write_task.cancel()
         if self._client and self._client.is_connected:
             logging.info("BleakTransport: Disconnecting client...")
             try:
@@ -132,46 +311,64 @@ class BleakTransport(BaseTransport):
             logging.info("BleakTransport: Client disconnected")
 
     def disconnect(self):
-        self._stopping = True
         logging.info("BleakTransport: disconnect() called")
-        if self._loop and self._loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(self._async_disconnect(), self._loop)
-            try:
-                future.result(timeout=5)
-            except Exception as e:
-                logging.error(f"BleakTransport: Error during async disconnect: {e}")
-            self._loop.call_soon_threadsafe(self._loop.stop)
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2)
-            logging.info("BleakTransport: Thread joined")
+        # The loop is shared with other transports, so it keeps running
+        future = asyncio.run_coroutine_threadsafe(self._async_disconnect(), self._loop)
+        try:
+            future.result(timeout=10)
+        except Exception as e:
+            logging.error(f"BleakTransport: Error during async disconnect: {e}")
 
     def _notification_handler(self, sender, data):
-        with self._recv_lock:
+        with self._recv_cond:
             self._recv_buffer.extend(data)
-            logging.debug(f"BleakTransport: Received {len(data)} bytes")
-
-    def read(self, length: int) -> bytes:
-        for _ in range(50):
-            with self._recv_lock:
-                if len(self._recv_buffer) >= length:
-                    data = bytes(self._recv_buffer[:length])
-                    del self._recv_buffer[:length]
-                    return data
-                elif len(self._recv_buffer) > 0:
-                    data = bytes(self._recv_buffer)
-                    self._recv_buffer.clear()
-                    return data
-            time.sleep(0.1)
-        logging.warning("BleakTransport: Read timeout, no data received")
-        return bytes()
+            self._recv_cond.notify_all()
+        logging.debug(f"BleakTransport: Received {len(data)} bytes")
+
+    def read(self, length: int, timeout: float | None = None) -> bytes:
+        with self._recv_cond:
+            # Wake on the first notification instead of polling every 100 ms
+            if not self._recv_cond.wait_for(
+                lambda: self._recv_buffer or self._write_error,
+                timeout=5.0 if timeout is None else timeout,
+            ):
+                logging.warning("BleakTransport: Read timeout, no data received")
+                return bytes()
+            if not self._recv_buffer:
+                # A queued write failed: surface it now instead of waiting out
+                # the read timeout on a link that is gone
+                error, self._write_error = self._write_error, None
+                raise error
+            if len(self._recv_buffer) > length:
+                data = bytes(self._recv_buffer[:length])
+                del self._recv_buffer[:length]
+            else:
+                # Common case: the caller takes everything buffered so far
+                data = bytes(self._recv_buffer)
+                self._recv_buffer.clear()
+            return data
+
+    def _enqueue_write(self, frames):
+        # Writes use response=False, so there is no result to wait for; the
+        # caller only blocks when MAX_PENDING_WRITES submissions are queued
+        if not self._write_slots.acquire(timeout=10):
+            raise TimeoutError("BLE write queue is full")
+        with self._recv_cond:
+            error, self._write_error = self._write_error, None
+        if error:
+            self._write_slots.release()
+            raise error
+        self._loop.call_soon_threadsafe(self._write_queue.put_nowait, frames)
 
     def write(self, data: bytes):
         logging.debug(f"BleakTransport: Writing {len(data)} bytes")
-        future = asyncio.run_coroutine_threadsafe(
-            self._client.write_gatt_char(self.CHAR_UUID, data, response=False),
-            self._loop
-        )
-        future.result(timeout=10)
+        self._enqueue_write((bytes(data),))
+
+    def write_many(self, frames: list[bytes]):
+        # Queued as a single submission; the pump packs the frames into
+        # MTU-sized GATT writes
+        logging.debug(f"BleakTransport: Writing {len(frames)} packets")
+        self._enqueue_write(tuple(frames))
 
 
 class SerialTransport(BaseTransport):
@@ -190,8 +387,15 @@ class SerialTransport(BaseTransport):
             raise RuntimeError(msg)
         return all_ports[0][0]
 
-    def read(self, length: int) -> bytes:
-        return self._serial.read(length)
+    def read(self, length: int, timeout: float | None = None) -> bytes:
+        if timeout is None or timeout >= self._serial.timeout:
+            return self._serial.read(length)
+        prev_timeout = self._serial.timeout
+        self._serial.timeout = timeout
+        try:
+            return self._serial.read(length)
+        finally:
+            self._serial.timeout = prev_timeout
 
     def write(self, data: bytes):
         return self._serial.write(data)
@@ -206,6 +410,7 @@ class RfcommTransport(BaseTransport):
         self._address = address.upper()
         self._channel = channel
         self._sock = None
+        self._rxbuf = bytearray()
         logging.info(f"RfcommTransport: Connecting to {self._address} channel {self._channel}")
         try:
             self._sock = socket.socket(socket.AF_BLUETOOTH, socket.SOCK_STREAM, socket.BTPROTO_RFCOMM)
@@ -237,18 +442,37 @@ class RfcommTransport(BaseTransport):
                 self._sock.close()
             raise ConnectionError(f"Failed to connect to {self._address}: {e}")
 
-    def read(self, length: int) -> bytes:
+    RECV_CHUNK = 4096
+
+    def read(self, length: int, timeout: float | None = None) -> bytes:
+        buf = self._rxbuf
         try:
-            return self._sock.recv(length)
+            if not buf:
+                # Block (up to the socket timeout, or a shorter caller
+                # timeout) for the first chunk only
+                if timeout is not None and not select.select([self._sock], [], [], timeout)[0]:
+                    return bytes()
+                buf.extend(self._sock.recv(self.RECV_CHUNK))
+            # The stack hands data up in small chunks; drain whatever else is
+            # already queued so one read returns all of it. The socket has a
+            # timeout, so poll with select() rather than let recv() wait on it
+            while select.select([self._sock], [], [], 0)[0]:
+                chunk = self._sock.recv(self.RECV_CHUNK)
+                if not chunk:
+                    break
+                buf.extend(chunk)
         except socket.timeout:
-            return bytes()
+            pass
         except Exception as e:
             logging.error(f"RfcommTransport: Read error: {e}")
-            return bytes()
+        data = bytes(buf[:length])
+        del buf[:length]
+        return data
 
     def write(self, data: bytes):
         try:
-            return self._sock.send(data)
+            # sendall: batched writes can exceed what a single send() accepts
+            return self._sock.sendall(data)
         except Exception as e:
             logging.error(f"RfcommTransport: Write error: {e}")
             raise
@@ -278,61 +502,63 @@ class BluetoothDeviceInfo:
         return self.device_type in ["classic", "dual"]
 
     def is_rfcomm_printer(self) -> bool:
-        SPP_UUID = "00001101-0000-1000-8000-00805f9b34fb"
-        return SPP_UUID.lower() in [u.lower() for u in self.uuids]
+        return any(u.lower() == SPP_UUID for u in self.uuids)
+
+
+async def _find_ble_device(address: str):
+    try:
+        from bleak import BleakScanner
+        logging.info(f"Scanning for BLE device: {address}")
+        # Returns as soon as the address advertises instead of waiting out
+        # the full discovery window
+        return await BleakScanner.find_device_by_address(address, timeout=10.0)
+    except Exception as e:
+        logging.warning(f"BLE scan failed: {e}")
+        return None
 
 
 async def detect_bluetooth_device_type(address: str) -> BluetoothDeviceInfo:
-    import subprocess
     address_upper = address.upper()
+    # The classic (bluetoothctl) and BLE lookups are independent, so run the
+    # BLE scan while the classic check is in flight
+    ble_task = asyncio.create_task(_find_ble_device(address_upper))
     classic_info = await _check_classic_bluetooth(address_upper)
     if classic_info:
-        if any(uuid.lower() == "00001101-0000-1000-8000-00805f9b34fb" for uuid in classic_info.get("uuids", [])):
+        if any(uuid.lower() == SPP_UUID for uuid in classic_info.get("uuids", [])):
             logging.info(f"Found Classic Bluetooth printer with SPP: {classic_info.get('name', 'Unknown')}")
+            ble_task.cancel()
             return BluetoothDeviceInfo(address_upper, classic_info.get("name", "Unknown"), "classic", classic_info.get("uuids", []))
-    try:
-        from bleak import BleakScanner
-        logging.info(f"Scanning for BLE device: {address_upper}")
-        devices = await BleakScanner.discover(timeout=10.0)
-        for device in devices:
-            if device.address.upper() == address_upper:
-                logging.info(f"Found BLE device: {device.name} ({device.address})")
-                ble_uuids = []
-                try:
-                    if hasattr(device, 'metadata') and device.metadata:
-                        ble_uuids = list(device.metadata.get("uuids", []))
-                except (AttributeError, TypeError):
-                    pass
-                if classic_info:
-                    return BluetoothDeviceInfo(address_upper, device.name or classic_info.get("name", "Unknown"), "dual", ble_uuids + classic_info.get("uuids", []))
-                return BluetoothDeviceInfo(address_upper, device.name or "Unknown", "ble", ble_uuids)
-    except Exception as e:
-        logging.warning(f"BLE scan failed: {e}")
+    device = await ble_task
+    if device:
+        logging.info(f"Found BLE device: {device.name} ({device.address})")
+        ble_uuids = []
+        try:
+            if hasattr(device, 'metadata') and device.metadata:
+                ble_uuids = list(device.metadata.get("uuids", []))
+        except (AttributeError, TypeError):
+            pass
+        if classic_info:
+            return BluetoothDeviceInfo(address_upper, device.name or classic_info.get("name", "Unknown"), "dual", ble_uuids + classic_info.get("uuids", []))
+        return BluetoothDeviceInfo(address_upper, device.name or "Unknown", "ble", ble_uuids)
     if classic_info:
         return BluetoothDeviceInfo(address_upper, classic_info.get("name", "Unknown"), "classic", classic_info.get("uuids", []))
     raise ValueError(f"Bluetooth device {address_upper} not found or not responding")
 
 
+# `bluetoothctl info` lines: "\tName: B1-H123" and "\tUUID: Serial Port (00001101-...)"
+_BTCTL_NAME_RE = re.compile(r"^\s*Name:[ \t]*(.*?)\s*$", re.MULTILINE)
+_BTCTL_UUID_RE = re.compile(r"^\s*UUID:[^(\n]*\(\s*([^)\n]*?)\s*\)", re.MULTILINE)
+
 async def _check_classic_bluetooth(address: str) -> dict:
-    import asyncio
-    import subprocess
     try:
         proc = await asyncio.create_subprocess_exec("bluetoothctl", "info", address, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
         stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
         if proc.returncode != 0:
             return None
         output = stdout.decode('utf-8')
-        name = None
-        uuids = []
-        for line in output.split('\n'):
-            line = line.strip()
-            if line.startswith("Name:"):
-                name = line.split("Name:", 1)[1].strip()
-            elif line.startswith("UUID:"):
-                uuid_part = line.split("UUID:", 1)[1].strip()
-                if "(" in uuid_part and ")" in uuid_part:
-                    uuid = uuid_part.split("(")[1].split(")")[0].strip()
-                    uuids.append(uuid)
+        name_match = _BTCTL_NAME_RE.search(output)
+        name = name_match.group(1) if name_match else None
+        uuids = _BTCTL_UUID_RE.findall(output)
         if name or uuids:
             return {"name": name, "uuids": uuids}
     except Exception as e:
@@ -367,7 +593,7 @@ class PrinterClient:
 
     def set_dimension_v5(self, w, h, qty=1):
         logging.info(f"Setting dimensions V5: width={w}, height={h}, qty={qty}")
-        payload = struct.pack(">HHH H B B B H", h, w, qty, 0, 0, 0, 1, 0)
+        payload = _PAGE_SIZE_V5.pack(h, w, qty, 0, 0, 0, 1, 0)
         packet = self._transceive(RequestCodeEnum.SET_DIMENSION, payload)
         return bool(packet)
 
@@ -407,14 +633,15 @@ class PrinterClient:
             # No rotation = correct orientation, but was cutoff due to RFID dimension mismatch (now fixed)
             logging.info(f"B1: Image {image.width}x{image.height}px (no rotation applied)")
 
-            # DEBUG: Save rotated image to /tmp
-            try:
-                ts = int(time.time())
-                debug_path = f"/tmp/b1_print_{ts}.png"
-                image.save(debug_path)
-                logging.info(f"DEBUG IMAGE SAVED (rotated): {debug_path}")
-            except Exception:
-                pass
+            # DEBUG: Save rotated image to /tmp when NIIMBOT_DEBUG_SAVE is set
+            if os.getenv("NIIMBOT_DEBUG_SAVE"):
+                try:
+                    ts = int(time.time())
+                    debug_path = f"/tmp/b1_print_{ts}.png"
+                    image.save(debug_path)
+                    logging.info(f"DEBUG IMAGE SAVED (rotated): {debug_path}")
+                except Exception:
+                    pass
 
             # 1. SetDensity (0x21)
             if not self.set_label_density(density):
@@ -443,34 +670,39 @@ class PrinterClient:
             # For rotated image: rows=384, cols=240, qty=1
             # Payload: 01 80 (384) 00 f0 (240) 00 01 (1)
             w, h = image.width, image.height
-            sd_payload = struct.pack(">HHH", h, w, 1)
+            sd_payload = _PAGE_SIZE.pack(h, w, 1)
             logging.info(f"SetPageSize: rows={h}, cols={w}, bytes_per_row={w//8} -> payload={sd_payload.hex()}")
             self._send(NiimbotPacket(0x13, sd_payload))
             time.sleep(0.2)
 
-            # 6. Image Data - SIMPLE ROW-BY-ROW ENCODING (Fix 3 from analysis)
-            # Diagnostic mode: no compression, no empty row skipping, no indexed mode
-            # This helps isolate if compression/optimization is causing issues
-
-            img_l = image.convert("L")
-            cols = img_l.width
-            rows = img_l.height
-            bytes_per_row = (cols + 7) // 8
-
-            logging.info(f"Simple encoding (diagnostic): rows={rows}, cols={cols}, bytes_per_row={bytes_per_row}")
-
-            for y in range(rows):
-                line_data = self._get_line_data(img_l, y, cols)
-
-                # Simple header: Row(2), C1=0, C2=0, C3=0, Rep=1
-                header = struct.pack(">H B B B B", y, 0, 0, 0, 1)
-                self._send(NiimbotPacket(0x85, header + line_data))
-                time.sleep(0.015)
-
-                if y % 50 == 0:
-                    logging.info(f"Sent row {y}/{rows}")
-
-            logging.info(f"Sent all {rows} rows (simple encoding)")
+            # 6. Image Data - ROW-BY-ROW ENCODING (Fix 3 from analysis)
+            # One 0x85 packet per row unless NIIMBOT_B1_COMPRESS_ROWS is set,
+            # which sends runs of identical rows once as niimbluelib does.
+            # The compressed stream has not been verified on B1 hardware.
+            # No indexed mode.
+
+            cols = image.width
+            rows = image.height
+            compress = bool(os.getenv("NIIMBOT_B1_COMPRESS_ROWS"))
+            # Threshold and pack the whole image once; each row is then just
+            # a slice of the bitmap
+            bitmap, bytes_per_row = _threshold_bitmap(image)
+
+            logging.info(
+                f"Simple encoding: rows={rows}, cols={cols}, bytes_per_row={bytes_per_row}, "
+                f"compress_rows={compress}"
+            )
+
+            frames = []
+            packets_sent = 0
+            for frame in _b1_row_frames(bitmap, bytes_per_row, compress):
+                frames.append(frame)
+                if len(frames) == _ROWS_PER_WRITE:
+                    packets_sent += self._send_paced(frames, 0.015)
+            if frames:
+                packets_sent += self._send_paced(frames, 0.015)
+
+            logging.info(f"Sent all {rows} rows in {packets_sent} packets")
 
         elif is_v5:
             logging.info("Using V5 protocol variant")
@@ -483,22 +715,24 @@ class PrinterClient:
             time.sleep(0.2)
 
             w, h = image.width, image.height
-            sd_payload = struct.pack(">HHH H B B B H", h, w, 1, 0, 0, 0, 1, 0)
+            sd_payload = _PAGE_SIZE_V5.pack(h, w, 1, 0, 0, 0, 1, 0)
             self._send(NiimbotPacket(0x13, sd_payload))
             time.sleep(0.2)
 
-            img_l = image.convert("L")
-            for y in range(img_l.height):
-                line_pixels = [img_l.getpixel((x, y)) for x in range(img_l.width)]
-                line_bits_str = "".join("1" if pix < 128 else "0" for pix in line_pixels)
-                if len(line_bits_str) % 8 != 0:
-                    line_bits_str += "0" * (8 - (len(line_bits_str) % 8))
-                total_pixels = line_bits_str.count("1")
-                line_data = int(line_bits_str, 2).to_bytes(len(line_bits_str) // 8, "big")
+            bitmap, stride = _threshold_bitmap(image)
+            bits = memoryview(bitmap)
+            row_pkt = PacketBuffer(0x85, 6 + stride)
+            row_payload = row_pkt.payload
+            frames = []
+            for y in range(h):
+                line = bits[y * stride : (y + 1) * stride]
+                total_pixels = int.from_bytes(line, "big").bit_count()
                 t_l, t_h = total_pixels & 0xff, (total_pixels >> 8) & 0xff
-                header = struct.pack(">H B B B B", y, 0, t_l, t_h, 1)
-                self._send(NiimbotPacket(0x85, header + line_data))
-                time.sleep(0.01)
+                _ROW_HEADER.pack_into(row_payload, 0, y, 0, t_l, t_h, 1)
+                row_payload[6:] = line
+                frames.append(row_pkt.to_bytes())
+                if len(frames) == _ROWS_PER_WRITE or y == h - 1:
+                    self._send_paced(frames, 0.01)
         else:
             logging.info("Using legacy protocol variant")
             self.set_label_density(density)
@@ -511,10 +745,12 @@ class PrinterClient:
         logging.info("Sending PageEnd...")
         self.end_page_print()
 
-        # Wait for printer to finish processing (B1 needs more time)
-        # niimbluelib polls status, but simple wait should work for now
+        # Wait for printer to finish processing (B1 needs up to 3 s). Poll the
+        # print status like niimbluelib and stop as soon as the page is done;
+        # printers that don't answer GET_PRINT_STATUS give up after 3 s.
         logging.info("Waiting for print to complete...")
-        time.sleep(3.0)  # Increased from 0.3 to 3.0 seconds
+        if not self._wait_for_print(pages=1, timeout=3.0):
+            logging.info("Print status not confirmed, continuing after timeout")
 
         logging.info("Sending PrintEnd...")
         if not self.end_print():
@@ -525,49 +761,103 @@ class PrinterClient:
         return True, "Print completed successfully"
 
     def _encode_image_v5(self, image: Image):
-        img = image.convert("L")
-        for y in range(img.height):
-            line_pixels = [img.getpixel((x, y)) for x in range(img.width)]
-            line_bits_str = "".join("1" if pix < 128 else "0" for pix in line_pixels)
-            if len(line_bits_str) % 8 != 0:
-                line_bits_str += "0" * (8 - (len(line_bits_str) % 8))
-            total_pixels = line_bits_str.count("1")
-            line_data = int(line_bits_str, 2).to_bytes(len(line_bits_str) // 8, "big")
+        bitmap, stride = _threshold_bitmap(image)
+        for y in range(image.height):
+            line_data = bitmap[y * stride : (y + 1) * stride]
+            total_pixels = int.from_bytes(line_data, "big").bit_count()
             t_l, t_h = total_pixels & 0xff, (total_pixels >> 8) & 0xff
-            header = struct.pack(">H B B B B", y, 0, t_l, t_h, 1)
+            header = _ROW_HEADER.pack(y, 0, t_l, t_h, 1)
             yield NiimbotPacket(0x85, header + line_data)
 
     def _encode_image(self, image: Image):
-        img = image.convert("L").convert("1")
+        img = _to_grayscale(image).convert("1")
+        # Mode "1" is already packed 8 pixels per byte, MSB first
+        raw = img.tobytes()
+        stride = (img.width + 7) // 8
+        # tobytes() pads each row at the end; this format right-aligns the row
+        pad = stride * 8 - img.width
         for y in range(img.height):
-            line_pixels = [img.getpixel((x, y)) for x in range(img.width)]
-            line_bits = "".join("0" if pix == 0 else "1" for pix in line_pixels)
-            line_bytes = int(line_bits, 2).to_bytes(math.ceil(img.width / 8), "big")
-            header = struct.pack(">H3BB", y, 0, 0, 0, 1)
+            line_bytes = raw[y * stride : (y + 1) * stride]
+            if pad:
+                line_bytes = (int.from_bytes(line_bytes, "big") >> pad).to_bytes(stride, "big")
+            header = _ROW_HEADER.pack(y, 0, 0, 0, 1)
             yield NiimbotPacket(0x85, header + line_bytes)
 
-    def _recv(self):
+    def _recv(self, timeout=None):
         packets = []
-        self._packetbuf.extend(self._transport.read(1024))
-        while len(self._packetbuf) > 4:
-            pkt_len = self._packetbuf[3] + 7
-            if len(self._packetbuf) >= pkt_len:
-                packet = NiimbotPacket.from_bytes(self._packetbuf[:pkt_len])
-                packets.append(packet)
-                del self._packetbuf[:pkt_len]
+        buf = self._packetbuf
+        buf.extend(self._transport.read(1024, timeout))
+        # Walk the buffer with an offset and drop the consumed prefix once at
+        # the end, instead of shifting the tail down after every packet
+        offset = 0
+        while len(buf) - offset > 4:
+            pkt_len = buf[offset + 3] + 7
+            if len(buf) - offset < pkt_len:
+                # Partial packet: keep it for the next read
+                break
+            packets.append(NiimbotPacket.from_bytes(buf[offset : offset + pkt_len]))
+            offset += pkt_len
+        if offset == len(buf):
+            buf.clear()
+        elif offset:
+            del buf[:offset]
         return packets
 
     def _send(self, packet):
         self._transport.write(packet.to_bytes())
 
-    def _transceive(self, reqcode, data, respoffset=1):
+    def _send_many(self, frames):
+        """Send already-encoded packets through one transport write."""
+        self._transport.write_many(frames)
+
+    def _send_paced(self, frames, delay_per_packet):
+        """
+        Send a batch of encoded packets, then wait out the rest of
+        ``delay_per_packet`` per packet so the printer sees the same average
+        packet rate. Clears ``frames`` and returns how many packets were sent.
+        """
+        count = len(frames)
+        # Time spent in the write itself counts toward the pacing gap
+        deadline = time.monotonic() + delay_per_packet * count
+        self._send_many(frames)
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        frames.clear()
+        return count
+
+    def _transceive(self, reqcode, data, respoffset=1, timeout=None):
+        """
+        Send a request and return the matching response packet, or None.
+
+        Without ``timeout`` this makes up to six reads at the transport's own
+        read timeout; with it, the whole exchange gives up after ``timeout``
+        seconds.
+        """
+        # Plain int: the response loop and packet encoding then skip IntEnum
+        # dispatch on every comparison
+        reqcode = int(reqcode)
         respcode = respoffset + reqcode
+        deadline = None if timeout is None else time.monotonic() + timeout
         self._send(NiimbotPacket(reqcode, data))
         for _ in range(6):
-            for packet in self._recv():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+            packets = self._recv(remaining)
+            for packet in packets:
                 if packet.type == respcode or packet.type == 0:
                     return packet
-            time.sleep(0.1)
+            # Transport reads already block until data arrives (BLE reads wake
+            # on the notification itself), so only back off when nothing came
+            # in; after an unrelated packet, go straight back to reading
+            if not packets:
+                if deadline is None:
+                    time.sleep(0.1)
+                else:
+                    time.sleep(max(0.0, min(0.1, deadline - time.monotonic())))
         return None
 
     def get_info(self, key):
@@ -600,26 +890,11 @@ class PrinterClient:
         # Log raw response for debugging
         logging.debug(f"Heartbeat response: len={len(packet.data)}, data={packet.data.hex()}")
 
-        match len(packet.data):
-            case 20:
-                paperstate = packet.data[18]
-                rfidreadstate = packet.data[19]
-            case 13:
-                closingstate = packet.data[9]
-                powerlevel = packet.data[10]
-                paperstate = packet.data[11]
-                rfidreadstate = packet.data[12]
-            case 19:
-                closingstate = packet.data[15]
-                powerlevel = packet.data[16]
-                paperstate = packet.data[17]
-                rfidreadstate = packet.data[18]
-            case 10:
-                closingstate = packet.data[8]
-                powerlevel = packet.data[9]
-                rfidreadstate = packet.data[8]
-            case 9:
-                closingstate = packet.data[8]
+        layout = _HEARTBEAT_LAYOUTS.get(len(packet.data))
+        if layout:
+            closingstate, powerlevel, paperstate, rfidreadstate = (
+                None if i is None else packet.data[i] for i in layout
+            )
 
         return {
             "closingstate": closingstate,
@@ -712,6 +987,26 @@ class PrinterClient:
         packet = self._transceive(RequestCodeEnum.SET_DIMENSION, struct.pack(">HH", w, h))
         return bool(packet.data[0]) if packet else False
 
+    def get_print_status(self, timeout=None):
+        packet = self._transceive(RequestCodeEnum.GET_PRINT_STATUS, b"\x01", 16, timeout)
+        if not packet or len(packet.data) < 4:
+            return None
+        page, progress1, progress2 = struct.unpack_from(">HBB", packet.data)
+        return {"page": page, "progress1": progress1, "progress2": progress2}
+
+    def _wait_for_print(self, pages, timeout):
+        """Poll print status until ``pages`` pages are reported or ``timeout`` expires."""
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            # Each poll only gets the time left, so a printer that never
+            # answers costs ``timeout`` in total rather than a full
+            # _transceive read cycle per poll
+            status = self.get_print_status(timeout=remaining)
+            if status and status["page"] >= pages:
+                return True
+            time.sleep(max(0.0, min(0.1, deadline - time.monotonic())))
+        return False
+
     def set_quantity(self, n):
         packet = self._transceive(RequestCodeEnum.SET_QUANTITY, struct.pack(">H", n))
         return bool(packet.data[0]) if packet else False
@@ -719,31 +1014,29 @@ class PrinterClient:
     def get_rfid(self):
         packet = self._transceive(RequestCodeEnum.GET_RFID, b"\x01")
         if not packet or len(packet.data) < 4:
-            logging.warning(f"RFID response too short or invalid: {packet.data.hex() if packet else 'None'}")
+            logging.warning("RFID response too short or invalid: %s", packet.data.hex() if packet else "None")
             return None
         try:
+            # Log-only hex dumps are built only when INFO is enabled; raw_hex
+            # itself is needed for the result and the failure warning
+            log_info = logging.getLogger().isEnabledFor(logging.INFO)
             raw_hex = packet.data.hex()
-            logging.info(f"RFID raw response ({len(packet.data)} bytes): {raw_hex}")
+            if log_info:
+                logging.info(f"RFID raw response ({len(packet.data)} bytes): {raw_hex}")
             if packet.data[0] != 0x88:
-                logging.warning(f"Unexpected RFID tag: 0x{packet.data[0]:02x} (expected 0x88)")
+                logging.warning("Unexpected RFID tag: 0x%02x (expected 0x88)", packet.data[0])
                 return None
             data_length = packet.data[1]
             rfid_payload = packet.data[2:2+data_length]
-            logging.info(f"RFID payload ({len(rfid_payload)} bytes): {rfid_payload.hex()}")
+            if log_info:
+                logging.info(f"RFID payload ({len(rfid_payload)} bytes): {rfid_payload.hex()}")
             product_code = ""
             try:
-                ascii_portion = ""
-                for byte in rfid_payload:
-                    if 32 <= byte <= 126:
-                        ascii_portion += chr(byte)
-                    elif ascii_portion:
-                        if len(ascii_portion) > 3:
-                            product_code = ascii_portion
-                            break
-                        ascii_portion = ""
+                if match := _RFID_PRODUCT_CODE_RE.search(rfid_payload):
+                    product_code = match.group().decode("ascii")
             except Exception as e:
                 logging.debug(f"Could not extract ASCII product code: {e}")
-            dimensions = self._detect_dimensions_from_rfid_response(packet.data, raw_hex)
+            dimensions = self._detect_dimensions_from_rfid_response(packet.data)
             if dimensions:
                 rfid_data = {
                     "width_mm": dimensions["width_mm"],
@@ -762,29 +1055,17 @@ class PrinterClient:
             logging.error(f"Error parsing RFID data: {e}", exc_info=True)
             return None
 
-    def _detect_dimensions_from_rfid_response(self, response_bytes: bytes, hex_string: str) -> dict | None:
-        KNOWN_RFID_SIGNATURES = {
-            "881d86286c121080": {"width_mm": 50, "height_mm": 30},
-        }
-        for signature, dimensions in KNOWN_RFID_SIGNATURES.items():
-            if hex_string.startswith(signature):
-                logging.info(f"Matched RFID signature: {signature}")
-                return dimensions
+    def _detect_dimensions_from_rfid_response(self, response_bytes: bytes) -> dict | None:
+        for signature, width, height in _KNOWN_RFID_SIGNATURES:
+            if response_bytes.startswith(signature):
+                logging.info(f"Matched RFID signature: {signature.hex()}")
+                return {"width_mm": width, "height_mm": height}
         try:
             if len(response_bytes) > 17:
-                width = response_bytes[16]
-                height = response_bytes[17]
+                width, height = _RFID_DIMENSIONS.unpack_from(response_bytes, 16)
                 if 10 <= width <= 200 and 10 <= height <= 200:
                     logging.info(f"Extracted dimensions from byte offsets: {width}x{height}mm")
                     return {"width_mm": width, "height_mm": height}
         except Exception as e:
             logging.debug(f"Could not extract dimensions from byte offsets: {e}")
         return None
-
-    def _get_line_data(self, img_l, y, cols):
-        """Helper to extract binary line data from image"""
-        line_pixels = [img_l.getpixel((x, y)) for x in range(cols)]
-        line_bits_str = "".join("1" if pix < 128 else "0" for pix in line_pixels)
-        if len(line_bits_str) % 8 != 0:
-            line_bits_str += "0" * (8 - (len(line_bits_str) % 8))
-        return int(line_bits_str, 2).to_bytes(len(line_bits_str) // 8, "big")
@@ -2474,6 +2474,8 @@ async def enrich_items_from_data_tags(
             continue
         
         # Find data tag photos for this item
+        # item.photos is already selectin-loaded, so filter it in Python
+        # rather than lazy-loading a second collection per item
         data_tag_photos = [p for p in item.photos if p.is_data_tag]
         if not data_tag_photos:
             items_skipped += 1
@@ -310,11 +310,11 @@ async def process_csv_import(
                 elif create_locations:
                     # Create new location
                     new_location = models.Location(
+                        id=models.uuid7(),
                         name=location_name,
                         parent_id=parent_location_db_id
                     )
                     db.add(new_location)
-                    db.flush()
                     locations_cache[location_key] = new_location.id
                     location_id = new_location.id
                     result.locations_created += 1
@@ -351,8 +351,10 @@ async def process_csv_import(
                         "duration_months": warranty_duration
                     }]
             
-            # Create item
+            # Create item. The id is assigned up front instead of flushing per
+            # row, so the commit below writes all rows in batched INSERTs.
             item = models.Item(
+                id=models.uuid7(),
                 name=item_name,
                 description=description,
                 location_id=location_id,
@@ -367,7 +369,6 @@ async def process_csv_import(
                 warranties=warranties
             )
             db.add(item)
-            db.flush()
             result.items_created += 1
             
             # Download and attach images from URLs
@@ -802,11 +802,11 @@ def process_encircle_import(
                 if room_key not in sublocations_cache:
                     # Create new sub-location
                     new_sublocation = models.Location(
+                        id=models.uuid7(),
                         name=room_name,
                         parent_id=parent_location_db_id
                     )
                     db.add(new_sublocation)
-                    db.flush()
                     sublocations_cache[room_key] = new_sublocation.id
                     result.sublocations_created += 1
                     result.log.append(f"Created sub-location (room): {room_name}")
@@ -972,8 +972,11 @@ def process_encircle_import(
                         "notes": f"Warranty phone: {warranty_phone}" if warranty_phone else None
                     })
             
-            # Create item with current sub-location
+            # Create item with current sub-location. The id is assigned up front
+            # instead of flushing per row, so the commit below writes all rows
+            # in batched INSERTs.
             item = models.Item(
+                id=models.uuid7(),
                 name=name,
                 location_id=current_sublocation_id,
                 brand=brand,
@@ -987,7 +990,6 @@ def process_encircle_import(
                 warranties=warranties
             )
             db.add(item)
-            db.flush()
             result.items_created += 1
             
             # Match and attach images
@@ -155,7 +155,7 @@ def create_backup_data(db: Session, user_id: str) -> dict:
             "tenant_info": loc.tenant_info,
             "insurance_info": loc.insurance_info,
             "estimated_property_value": float(loc.estimated_property_value) if loc.estimated_property_value else None,
-            "location_type": loc.location_type.value if loc.location_type else None,
+            "location_type": loc.location_type,
             "created_at": loc.created_at.isoformat() if loc.created_at else None,
             "updated_at": loc.updated_at.isoformat() if loc.updated_at else None,
         }
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from uuid import UUID
 from .. import models, schemas, auth
@@ -13,7 +13,10 @@ router = APIRouter(prefix="/locations", tags=["locations"])
 @router.get("/", response_model=List[schemas.Location])
 def list_locations(db: Session = Depends(get_db)):
     """Get all locations. Always returns a JSON array, even if empty."""
-    return db.query(models.Location).all()
+    return db.query(models.Location).options(
+        selectinload(models.Location.videos),
+        selectinload(models.Location.location_photos),
+    ).all()
 
 
 @router.post("/", response_model=schemas.Location, status_code=status.HTTP_201_CREATED)
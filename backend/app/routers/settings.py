@@ -6,6 +6,7 @@ from .. import models, schemas
 from ..deps import get_db
 from ..auth import get_current_user
 from ..logging_config import get_logger
+from ..settings_service import invalidate_settings_cache
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/settings", tags=["settings"])
@@ -66,6 +67,7 @@ def update_settings(
         setattr(settings_obj, key, value)
     
     db.commit()
+    invalidate_settings_cache()
     db.refresh(settings_obj)
     logger.info(f"System settings updated by {current_user.email}")
     return settings_obj
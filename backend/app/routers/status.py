@@ -318,7 +318,7 @@ async def update_api_keys(
     Keys can only be updated if they are NOT set via environment variables.
     Environment variables always take priority - this is a security feature.
     """
-    from ..settings_service import is_gemini_model_from_env
+    from ..settings_service import is_gemini_model_from_env, invalidate_settings_cache
     from ..config import AVAILABLE_GEMINI_MODELS
     
     # Only admins can update API keys
@@ -382,6 +382,7 @@ async def update_api_keys(
         db_settings.google_client_secret = api_keys.google_client_secret if api_keys.google_client_secret else None
     
     db.commit()
+    invalidate_settings_cache()
     
     # Get current configuration status
     gemini_api_key = settings.GEMINI_API_KEY if gemini_from_env else db_settings.gemini_api_key
@@ -553,6 +553,7 @@ class ItemUpdate(BaseModel):
 
 class Item(ItemBase):
     id: UUID
+    primary_photo_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
     photos: List['Photo'] = []
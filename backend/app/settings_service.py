@@ -5,12 +5,56 @@ environment variables and database.
 Environment variables always take priority over database settings.
 """
 
+import time
+from dataclasses import dataclass
 from typing import Optional, Tuple
 from sqlalchemy.orm import Session
 
 from .config import settings
 from . import models
 
+# The system_settings row changes rarely, so its values are cached per
+# process. Writers call invalidate_settings_cache(); the TTL bounds staleness
+# for writes made by another process.
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class _DbSettings:
+    gemini_api_key: Optional[str]
+    gemini_model: Optional[str]
+    google_client_id: Optional[str]
+    google_client_secret: Optional[str]
+
+
+_settings_cache: Optional[Tuple[float, Optional[_DbSettings]]] = None
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached system_settings values (call after updating the row)."""
+    global _settings_cache
+    _settings_cache = None
+
+
+def _get_db_settings(db: Session) -> Optional[_DbSettings]:
+    """Return the system_settings values, querying at most once per TTL."""
+    global _settings_cache
+    now = time.monotonic()
+    if _settings_cache is not None and now - _settings_cache[0] < SETTINGS_CACHE_TTL_SECONDS:
+        return _settings_cache[1]
+
+    row = db.get(models.SystemSettings, 1)
+    snapshot = None
+    if row is not None:
+        snapshot = _DbSettings(
+            gemini_api_key=row.gemini_api_key,
+            gemini_model=row.gemini_model,
+            google_client_id=row.google_client_id,
+            google_client_secret=row.google_client_secret,
+        )
+    _settings_cache = (now, snapshot)
+    return snapshot
+
 
 def get_effective_gemini_api_key(db: Session) -> Optional[str]:
     """
@@ -28,7 +72,7 @@ def get_effective_gemini_api_key(db: Session) -> Optional[str]:
         return settings.GEMINI_API_KEY.strip()
     
     # Fall back to database
-    db_settings = db.query(models.SystemSettings).first()
+    db_settings = _get_db_settings(db)
     if db_settings and db_settings.gemini_api_key and db_settings.gemini_api_key.strip():
         return db_settings.gemini_api_key.strip()
     
@@ -52,7 +96,7 @@ def get_effective_google_oauth(db: Session) -> Tuple[Optional[str], Optional[str
         return settings.GOOGLE_CLIENT_ID.strip(), settings.GOOGLE_CLIENT_SECRET.strip()
     
     # Fall back to database
-    db_settings = db.query(models.SystemSettings).first()
+    db_settings = _get_db_settings(db)
     if (db_settings and 
         db_settings.google_client_id and db_settings.google_client_secret and
         db_settings.google_client_id.strip() and db_settings.google_client_secret.strip()):
@@ -97,7 +141,7 @@ def get_effective_gemini_model(db: Session) -> str:
             return env_model
     
     # Fall back to database
-    db_settings = db.query(models.SystemSettings).first()
+    db_settings = _get_db_settings(db)
     if db_settings and db_settings.gemini_model and db_settings.gemini_model.strip():
         return db_settings.gemini_model.strip()
     
@@ -0,0 +1,210 @@
+"""
+Tests for monetary columns stored as integer cents.
+
+Covers:
+- money_property get/set round trip (None, rounding, Decimal vs float input)
+- The SQL expression used when filtering on a dollar property
+- run_migrations() copying legacy NUMERIC values into *_cents exactly once
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import Base
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'money.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# money_property: Python side
+# ---------------------------------------------------------------------------
+
+class TestMoneyPropertyRoundTrip:
+    def test_decimal_is_stored_as_cents(self):
+        item = models.Item(name="Lamp", purchase_price=Decimal("12.34"))
+        assert item.purchase_price_cents == 1234
+        assert item.purchase_price == Decimal("12.34")
+
+    def test_none_clears_cents(self):
+        item = models.Item(name="Lamp", purchase_price=Decimal("1.00"))
+        item.purchase_price = None
+        assert item.purchase_price_cents is None
+        assert item.purchase_price is None
+
+    def test_unset_reads_as_none(self):
+        assert models.Item(name="Lamp").estimated_value is None
+
+    def test_half_cent_rounds_up(self):
+        item = models.Item(name="Lamp", purchase_price=Decimal("0.005"))
+        assert item.purchase_price_cents == 1
+        assert item.purchase_price == Decimal("0.01")
+
+    def test_just_below_half_cent_rounds_down(self):
+        item = models.Item(name="Lamp", purchase_price=Decimal("0.0049"))
+        assert item.purchase_price_cents == 0
+
+    def test_float_matches_decimal(self):
+        # 19.99 and 0.005 are not exact binary floats; the value must still
+        # land on the same cent as the equivalent Decimal
+        for value in ("19.99", "0.005", "1234567.89"):
+            from_float = models.Item(name="Lamp", purchase_price=float(value))
+            from_decimal = models.Item(name="Lamp", purchase_price=Decimal(value))
+            assert from_float.purchase_price_cents == from_decimal.purchase_price_cents
+
+    def test_int_and_str_input(self):
+        assert models.Item(name="Lamp", purchase_price=5).purchase_price == Decimal("5.00")
+        assert models.Item(name="Lamp", purchase_price="7.5").purchase_price_cents == 750
+
+    def test_getter_returns_two_decimal_places(self):
+        item = models.Item(name="Lamp", estimated_value=Decimal("3"))
+        assert str(item.estimated_value) == "3.00"
+
+    def test_location_values(self):
+        loc = models.Location(name="Home", estimated_property_value=Decimal("250000.50"))
+        assert loc.estimated_property_value_cents == 25000050
+        assert loc.estimated_property_value == Decimal("250000.50")
+
+    def test_round_trip_through_database(self, engine):
+        with Session(engine) as db:
+            item = models.Item(name="Lamp", purchase_price=Decimal("12.34"), estimated_value=0.1)
+            db.add(item)
+            db.commit()
+            item_id = item.id
+        with Session(engine) as db:
+            item = db.get(models.Item, item_id)
+            assert item.purchase_price == Decimal("12.34")
+            assert item.estimated_value == Decimal("0.10")
+
+
+# ---------------------------------------------------------------------------
+# money_property: SQL expression
+# ---------------------------------------------------------------------------
+
+class TestMoneyPropertyExpression:
+    def test_expression_reads_cents_column(self):
+        sql = str(models.Item.purchase_price.compile())
+        assert "purchase_price_cents" in sql
+
+    def test_filter_compares_in_dollars(self, engine):
+        with Session(engine) as db:
+            db.add_all([
+                models.Item(name="cheap", purchase_price=Decimal("9.99")),
+                models.Item(name="pricey", purchase_price=Decimal("10.01")),
+                models.Item(name="unpriced"),
+            ])
+            db.commit()
+            names = [
+                item.name
+                for item in db.query(models.Item).filter(models.Item.purchase_price > 10)
+            ]
+            assert names == ["pricey"]
+
+    def test_order_by_expression(self, engine):
+        with Session(engine) as db:
+            db.add_all([
+                models.Item(name="b", estimated_value=Decimal("2.50")),
+                models.Item(name="a", estimated_value=Decimal("1.25")),
+            ])
+            db.commit()
+            names = [
+                item.name
+                for item in db.query(models.Item).order_by(models.Item.estimated_value)
+            ]
+            assert names == ["a", "b"]
+
+
+# ---------------------------------------------------------------------------
+# run_migrations: legacy NUMERIC -> cents backfill
+# ---------------------------------------------------------------------------
+
+def make_legacy_schema(engine):
+    """Turn a freshly created schema into one from before the cents columns."""
+    with engine.begin() as conn:
+        for table_name, column in (
+            ("items", "purchase_price"),
+            ("items", "estimated_value"),
+            ("locations", "estimated_property_value"),
+            ("locations", "estimated_value_with_items"),
+        ):
+            conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column}_cents"))
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column} NUMERIC(12, 2)"))
+
+
+class TestCentsBackfill:
+    @pytest.fixture
+    def run_migrations(self, engine, monkeypatch):
+        from app import main
+        monkeypatch.setattr(main, "engine", engine)
+        return main.run_migrations
+
+    def insert_legacy_item(self, engine, purchase_price, estimated_value):
+        item_id = models.uuid7()
+        with engine.begin() as conn:
+            conn.execute(
+                models.Item.__table__.insert().values(id=item_id, name="Legacy"),
+            )
+            conn.execute(
+                text("UPDATE items SET purchase_price = :p, estimated_value = :e WHERE id = :id"),
+                {"p": purchase_price, "e": estimated_value, "id": str(item_id)},
+            )
+        return item_id
+
+    def read_cents(self, engine, item_id):
+        with engine.connect() as conn:
+            return conn.execute(
+                text("SELECT purchase_price_cents, estimated_value_cents FROM items WHERE id = :id"),
+                {"id": str(item_id)},
+            ).one()
+
+    def test_copies_legacy_values(self, engine, run_migrations):
+        make_legacy_schema(engine)
+        item_id = self.insert_legacy_item(engine, "12.34", None)
+
+        run_migrations()
+
+        assert tuple(self.read_cents(engine, item_id)) == (1234, None)
+        with Session(engine) as db:
+            item = db.get(models.Item, item_id)
+            assert item.purchase_price == Decimal("12.34")
+            assert item.estimated_value is None
+
+    def test_copies_location_values(self, engine, run_migrations):
+        make_legacy_schema(engine)
+        loc_id = models.uuid7()
+        with engine.begin() as conn:
+            conn.execute(models.Location.__table__.insert().values(id=loc_id, name="Home"))
+            conn.execute(
+                text("UPDATE locations SET estimated_property_value = 250000.5 WHERE id = :id"),
+                {"id": str(loc_id)},
+            )
+
+        run_migrations()
+
+        with Session(engine) as db:
+            assert db.get(models.Location, loc_id).estimated_property_value == Decimal("250000.50")
+
+    def test_runs_only_once(self, engine, run_migrations):
+        make_legacy_schema(engine)
+        item_id = self.insert_legacy_item(engine, "12.34", "99.99")
+        run_migrations()
+
+        # Later edits go through the cents columns; a stale legacy value must
+        # not be copied over them on the next start
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE items SET purchase_price = 1.00, purchase_price_cents = 4321 WHERE id = :id"),
+                {"id": str(item_id)},
+            )
+        run_migrations()
+
+        assert tuple(self.read_cents(engine, item_id)) == (4321, 9999)
@@ -0,0 +1,112 @@
+"""
+Tests for the B1 image row encoding in the NIIMBOT driver.
+
+Covers:
+- The default frame stream is the per-row baseline (one 0x85 per row, rep=1)
+- The compressed stream (0x84 blank runs, 0x85 repeat counts) expands back
+  to exactly the same rows as the baseline
+- Runs longer than 255 rows are split
+"""
+
+import struct
+
+import pytest
+
+from app.niimbot.packet import NiimbotPacket
+from app.niimbot.printer import _b1_row_frames
+
+BYTES_PER_ROW = 3
+BLANK = bytes(BYTES_PER_ROW)
+ROW_A = b"\xff\x00\x81"
+ROW_B = b"\x18\x3c\x18"
+
+
+def make_bitmap(rows):
+    return b"".join(rows)
+
+
+def baseline_frames(rows):
+    """The original B1 encoding: every row as its own 0x85 packet, rep=1."""
+    return [
+        NiimbotPacket(0x85, struct.pack(">HBBBB", y, 0, 0, 0, 1) + row).to_bytes()
+        for y, row in enumerate(rows)
+    ]
+
+
+def split_frames(stream):
+    """Split a concatenated frame stream back into NiimbotPackets."""
+    packets = []
+    offset = 0
+    while offset < len(stream):
+        length = stream[offset + 3] + 7
+        packets.append(NiimbotPacket.from_bytes(stream[offset : offset + length]))
+        offset += length
+    return packets
+
+
+def expand(frames):
+    """Render a frame stream into {row_number: row_bytes} as the printer would."""
+    rendered = {}
+    for pkt in split_frames(b"".join(frames)):
+        if pkt.type == 0x84:
+            start, repeat = struct.unpack(">HB", pkt.data)
+            data = BLANK
+        elif pkt.type == 0x85:
+            start, _, _, _, repeat = struct.unpack(">HBBBB", pkt.data[:6])
+            data = bytes(pkt.data[6:])
+        else:
+            pytest.fail(f"unexpected packet type {pkt.type:#x}")
+        assert repeat >= 1
+        for y in range(start, start + repeat):
+            assert y not in rendered, f"row {y} sent twice"
+            rendered[y] = data
+    return rendered
+
+
+@pytest.fixture
+def rows():
+    # Leading margin, a repeated run, a single row, a blank run longer than
+    # one 0x84 packet can cover, a repeat of an earlier row, trailing margin
+    return [BLANK] * 4 + [ROW_A] * 3 + [ROW_B] + [BLANK] * 300 + [ROW_A] + [BLANK] * 2
+
+
+# ---------------------------------------------------------------------------
+# Default (per-row) encoding
+# ---------------------------------------------------------------------------
+
+class TestPerRowEncoding:
+    def test_matches_baseline(self, rows):
+        frames = list(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW))
+        assert frames == baseline_frames(rows)
+
+    def test_blank_rows_are_sent_as_bitmap_rows(self, rows):
+        packets = split_frames(b"".join(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW)))
+        assert {pkt.type for pkt in packets} == {0x85}
+        assert len(packets) == len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Compressed encoding
+# ---------------------------------------------------------------------------
+
+class TestCompressedEncoding:
+    def test_renders_same_rows_as_baseline(self, rows):
+        frames = list(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW, compress=True))
+        assert expand(frames) == expand(baseline_frames(rows))
+
+    def test_sends_fewer_packets(self, rows):
+        frames = list(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW, compress=True))
+        # 4 blank, A x3, B, 255 + 45 blank, A, 2 blank
+        assert len(frames) == 7
+
+    def test_long_runs_are_split(self):
+        rows = [ROW_A] * 600
+        frames = list(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW, compress=True))
+        repeats = [pkt.data[5] for pkt in split_frames(b"".join(frames))]
+        assert repeats == [255, 255, 90]
+        assert expand(frames) == expand(baseline_frames(rows))
+
+    def test_no_repeats_matches_baseline(self):
+        rows = [ROW_A, ROW_B, ROW_A, ROW_B]
+        frames = list(_b1_row_frames(make_bitmap(rows), BYTES_PER_ROW, compress=True))
+        assert frames == baseline_frames(rows)
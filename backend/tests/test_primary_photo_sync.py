@@ -0,0 +1,230 @@
+"""
+Tests for keeping Item.primary_photo_id in step with Photo.is_primary.
+
+Covers the Photo mapper events (sync_item_primary_photo_on_insert,
+sync_item_primary_photo_on_update, clear_item_primary_photo):
+- Inserting a primary photo
+- Moving the primary flag to another photo, or the photo to another item
+- Deleting the primary photo
+- A CSV import that attaches photos with is_primary set
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import Base
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'photos.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def add_item(db, name="Camera"):
+    item = models.Item(name=name)
+    db.add(item)
+    db.commit()
+    return item
+
+
+def add_photo(db, item, is_primary=False, path="/uploads/photos/a.jpg"):
+    photo = models.Photo(item_id=item.id, path=path, is_primary=is_primary)
+    db.add(photo)
+    db.commit()
+    return photo
+
+
+def primary_photo_id(db, item):
+    db.expire(item)
+    return item.primary_photo_id
+
+
+# ---------------------------------------------------------------------------
+# Insert
+# ---------------------------------------------------------------------------
+
+class TestInsert:
+    def test_primary_photo_is_recorded(self, db):
+        item = add_item(db)
+        photo = add_photo(db, item, is_primary=True)
+        assert primary_photo_id(db, item) == photo.id
+
+    def test_non_primary_photo_is_ignored(self, db):
+        item = add_item(db)
+        add_photo(db, item, is_primary=False)
+        assert primary_photo_id(db, item) is None
+
+    def test_other_items_are_untouched(self, db):
+        item = add_item(db)
+        other = add_item(db, name="Tripod")
+        add_photo(db, item, is_primary=True)
+        assert primary_photo_id(db, other) is None
+
+    def test_photo_added_with_new_item_in_one_flush(self, db):
+        item = models.Item(id=models.uuid7(), name="Lens")
+        photo = models.Photo(id=models.uuid7(), item_id=item.id, path="/uploads/photos/b.jpg", is_primary=True)
+        db.add_all([item, photo])
+        db.commit()
+        assert primary_photo_id(db, item) == photo.id
+
+
+# ---------------------------------------------------------------------------
+# Moving the primary flag
+# ---------------------------------------------------------------------------
+
+class TestMovePrimary:
+    def test_flag_moved_between_photos(self, db):
+        item = add_item(db)
+        first = add_photo(db, item, is_primary=True, path="/uploads/photos/1.jpg")
+        second = add_photo(db, item, is_primary=False, path="/uploads/photos/2.jpg")
+
+        first.is_primary = False
+        second.is_primary = True
+        db.commit()
+
+        assert primary_photo_id(db, item) == second.id
+
+    def test_route_style_bulk_unset_then_set(self, db):
+        # routers/photos.py clears the old flag with a bulk query update
+        # (no mapper events) before setting the new one
+        item = add_item(db)
+        add_photo(db, item, is_primary=True, path="/uploads/photos/1.jpg")
+        second = add_photo(db, item, is_primary=False, path="/uploads/photos/2.jpg")
+
+        db.query(models.Photo).filter(
+            models.Photo.item_id == item.id,
+            models.Photo.is_primary,
+            models.Photo.id != second.id,
+        ).update({"is_primary": False})
+        second.is_primary = True
+        db.commit()
+
+        assert primary_photo_id(db, item) == second.id
+
+    def test_unsetting_the_primary_clears_it(self, db):
+        item = add_item(db)
+        photo = add_photo(db, item, is_primary=True)
+
+        photo.is_primary = False
+        db.commit()
+
+        assert primary_photo_id(db, item) is None
+
+    def test_primary_photo_moved_to_another_item(self, db):
+        # routers/photos.py and routers/media.py reassign photo.item_id
+        first = add_item(db)
+        second = add_item(db, name="Tripod")
+        photo = add_photo(db, first, is_primary=True)
+
+        photo.item_id = second.id
+        db.commit()
+
+        assert primary_photo_id(db, first) is None
+        assert primary_photo_id(db, second) == photo.id
+
+    def test_non_primary_photo_moved_to_another_item(self, db):
+        first = add_item(db)
+        second = add_item(db, name="Tripod")
+        primary = add_photo(db, first, is_primary=True, path="/uploads/photos/1.jpg")
+        other = add_photo(db, first, is_primary=False, path="/uploads/photos/2.jpg")
+
+        other.item_id = second.id
+        db.commit()
+
+        assert primary_photo_id(db, first) == primary.id
+        assert primary_photo_id(db, second) is None
+
+    def test_move_after_expire(self, db):
+        first = add_item(db)
+        second = add_item(db, name="Tripod")
+        photo = add_photo(db, first, is_primary=True)
+
+        db.expire(photo)
+        photo.item_id = second.id
+        db.commit()
+
+        assert primary_photo_id(db, first) is None
+        assert primary_photo_id(db, second) == photo.id
+
+    def test_unrelated_change_does_not_touch_item(self, db):
+        item = add_item(db)
+        photo = add_photo(db, item, is_primary=True)
+        updated_at = item.updated_at
+
+        photo.mime_type = "image/png"
+        db.commit()
+
+        db.expire(item)
+        assert item.primary_photo_id == photo.id
+        assert item.updated_at == updated_at
+
+
+# ---------------------------------------------------------------------------
+# Delete
+# ---------------------------------------------------------------------------
+
+class TestDelete:
+    def test_deleting_primary_photo_clears_it(self, db):
+        item = add_item(db)
+        photo = add_photo(db, item, is_primary=True)
+
+        db.delete(photo)
+        db.commit()
+
+        assert primary_photo_id(db, item) is None
+
+    def test_deleting_other_photo_keeps_primary(self, db):
+        item = add_item(db)
+        primary = add_photo(db, item, is_primary=True, path="/uploads/photos/1.jpg")
+        other = add_photo(db, item, is_primary=False, path="/uploads/photos/2.jpg")
+
+        db.delete(other)
+        db.commit()
+
+        assert primary_photo_id(db, item) == primary.id
+
+    def test_deleting_item_with_primary_photo(self, db):
+        item = add_item(db)
+        add_photo(db, item, is_primary=True)
+
+        db.delete(item)
+        db.commit()
+
+        assert db.query(models.Photo).count() == 0
+
+
+# ---------------------------------------------------------------------------
+# CSV import
+# ---------------------------------------------------------------------------
+
+class TestCsvImport:
+    def test_first_downloaded_image_becomes_primary(self, db, tmp_path):
+        from app.routers import csv_import
+
+        csv_content = (
+            "name,image_urls\n"
+            "Camera,https://example.com/a.jpg;https://example.com/b.jpg\n"
+            "Tripod,\n"
+        ).encode()
+        download = AsyncMock(return_value=(b"\xff\xd8\xff", ".jpg"))
+        with patch.object(csv_import, "download_image_from_url", download), \
+                patch.object(csv_import, "UPLOAD_DIR", tmp_path):
+            result = asyncio.run(csv_import.process_csv_import(csv_content, db))
+
+        assert result.errors == []
+        assert result.photos_attached == 2
+
+        camera = db.query(models.Item).filter_by(name="Camera").one()
+        tripod = db.query(models.Item).filter_by(name="Tripod").one()
+        primary = db.query(models.Photo).filter_by(item_id=camera.id, is_primary=True).one()
+        assert primary_photo_id(db, camera) == primary.id
+        assert primary_photo_id(db, tripod) is None